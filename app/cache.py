@@ -0,0 +1,111 @@
+"""
+Response Cache
+
+This module provides a small on-disk TTL cache for JSON-serializable Reddit
+API results, so repeated runs can skip network round-trips for data that
+changes slowly (subreddit metadata, popular subreddit listings).
+"""
+
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    A keyed on-disk cache whose entries expire after a time-to-live.
+    
+    Each entry is stored as a JSON file named after a hash of its key. The
+    TTL is checked against the file's modification time when reading, so
+    different callers can apply different TTLs to the same cache directory.
+    Entries read or written by this instance are also kept in memory, so
+    repeated lookups within a process skip the disk. Cached values are
+    shared, so callers must not mutate them.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Directory to store cache entries in (created on first write)
+        """
+        self.directory = directory
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+    
+    def _path(self, key: str) -> str:
+        """
+        Get the file path for a cache key.
+        
+        Args:
+            key: The cache key
+        
+        Returns:
+            str: Path of the JSON file holding the entry
+        """
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value if it exists and is younger than ``ttl`` seconds.
+        
+        Args:
+            key: The cache key
+            ttl: Maximum age of the entry in seconds
+        
+        Returns:
+            The cached value, or None on a miss or expired entry
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            return value if time.time() - stored_at <= ttl else None
+        
+        path = self._path(key)
+        try:
+            stored_at = os.path.getmtime(path)
+            if time.time() - stored_at > ttl:
+                return None
+            with open(path, "rb") as f:
+                value = orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        self._memory[key] = (stored_at, value)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value under ``key``.
+        
+        The entry is written to a temporary file and moved into place so
+        concurrent readers never see a partially written entry. Writing is
+        best-effort: if the directory is not writable, a warning is logged
+        and the entry is only kept in memory.
+        
+        Args:
+            key: The cache key
+            value: JSON-serializable value to store
+        """
+        self._memory[key] = (time.time(), value)
+        
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(value))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write cache entry %r to %s: %s", key, self.directory, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
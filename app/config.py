@@ -1,14 +1,41 @@
 import os
+from functools import lru_cache
+from typing import NamedTuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
 # Reddit API Configuration
-CLIENT_ID = os.getenv("CLIENT_ID")
-CLIENT_SECRET = os.getenv("CLIENT_SECRET")
-USER_AGENT = os.getenv("USER_AGENT")
+class Config(NamedTuple):
+    client_id: str
+    client_secret: str
+    user_agent: str
 
-# Validate that all required environment variables are set
-if not all([CLIENT_ID, CLIENT_SECRET, USER_AGENT]):
-    raise ValueError("Missing required environment variables. Please check your .env file.")
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Load the Reddit API configuration from the environment.
+    
+    The .env file is read on the first call only; later calls return the
+    cached configuration.
+    
+    Returns:
+        Config: The Reddit API credentials
+    
+    Raises:
+        ValueError: If any required environment variable is missing.
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+    
+    config = Config(
+        client_id=os.getenv("CLIENT_ID"),
+        client_secret=os.getenv("CLIENT_SECRET"),
+        user_agent=os.getenv("USER_AGENT")
+    )
+    
+    # Validate that all required environment variables are set
+    if not all(config):
+        raise ValueError("Missing required environment variables. Please check your .env file.")
+    
+    return config
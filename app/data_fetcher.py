@@ -2,15 +2,19 @@
 Data Fetching Service
 
 This module orchestrates the data collection process from Reddit,
-iterating through target subreddits and collecting posts and comments.
+fanning out over target subreddits concurrently and collecting posts and comments.
 """
 
-import time
+import asyncio
+import gzip
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, BinaryIO, List, Dict, Any, Optional, Sequence
 from datetime import datetime
 
-from .reddit_client import RedditClient
+import orjson
+
+from .models import Comment, Post
+from .reddit_client import MAX_LISTING_LIMIT, RedditClient
 from .settings import get_target_subreddits, get_fetching_config
 
 
@@ -21,35 +25,126 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of subreddits combined into one multireddit listing request
+MULTIREDDIT_CHUNK_SIZE = 10
+
+
+def _fields(item) -> Dict[str, Any]:
+    """
+    Get the loaded fields of a post or comment.
+    
+    Args:
+        item: Async PRAW object, or the raw dict returned by a JSON endpoint
+        
+    Returns:
+        Dict of the item's fields
+    """
+    return item if isinstance(item, dict) else vars(item)
+
+
+def _new_summary() -> Dict[str, Any]:
+    """
+    Create an empty collection summary.
+    
+    Returns:
+        Dict with zeroed counters and an empty error list
+    """
+    return {
+        "successful_subreddits": 0,
+        "failed_subreddits": 0,
+        "total_posts": 0,
+        "total_comments": 0,
+        "errors": []
+    }
+
+
+def open_output(path: str) -> BinaryIO:
+    """
+    Open an output file for writing, gzip-compressed if its name ends in ``.gz``.
+    
+    Collected Reddit data is highly redundant, so even the fastest gzip level
+    shrinks it several times over.
+    
+    Args:
+        path: Output file path
+        
+    Returns:
+        Binary file object to write to
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "wb", compresslevel=1)
+    return open(path, "wb", buffering=1 << 20)
+
+
+def _write_ndjson_record(output_file: BinaryIO, record: Dict[str, Any]) -> None:
+    """
+    Serialize a record and write it to a file as one NDJSON line.
+    
+    Args:
+        output_file: Binary file to write to
+        record: JSON-serializable record
+    """
+    output_file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
 
 class DataFetcher:
     """
     Service class for orchestrating Reddit data collection.
     
     This class manages the process of fetching posts and comments from
-    multiple subreddits using the RedditClient.
+    multiple subreddits concurrently using the RedditClient.
     """
     
-    def __init__(self, reddit_client: Optional[RedditClient] = None):
+    def __init__(self, reddit_client: Optional[RedditClient] = None, force_refresh: bool = False):
         """
         Initialize the DataFetcher.
         
         Args:
             reddit_client: Optional RedditClient instance. If not provided,
-                         a new one will be created.
+                         a new one will be created and closed by ``close()``.
+            force_refresh: Bypass the response cache and always fetch fresh data
         """
+        self._owns_client = reddit_client is None
         self.reddit_client = reddit_client or RedditClient()
         self.config = get_fetching_config()
-        self.target_subreddits = self._get_target_subreddits()
+        self.force_refresh = force_refresh
+        self.target_subreddits: Optional[Sequence[str]] = None
+        self._subreddit_semaphore = asyncio.Semaphore(self.config["subreddit_concurrency"])
+        self._comment_semaphore = asyncio.Semaphore(self.config["comment_concurrency"])
+        
+        logger.info("DataFetcher initialized")
+    
+    async def __aenter__(self) -> "DataFetcher":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the Reddit client if it was created by this DataFetcher.
+        """
+        if self._owns_client:
+            await self.reddit_client.close()
+    
+    async def load_target_subreddits(self) -> Sequence[str]:
+        """
+        Resolve the target subreddits once and cache them on the instance.
         
-        logger.info(f"DataFetcher initialized with {len(self.target_subreddits)} target subreddits")
+        Returns:
+            Sequence[str]: Subreddit names to fetch data from
+        """
+        if self.target_subreddits is None:
+            self.target_subreddits = await self._get_target_subreddits()
+            logger.info("Resolved %d target subreddits", len(self.target_subreddits))
+        return self.target_subreddits
     
-    def _get_target_subreddits(self) -> List[str]:
+    async def _get_target_subreddits(self) -> Sequence[str]:
         """
         Get the list of target subreddits based on configuration.
         
         Returns:
-            List[str]: List of subreddit names to fetch data from
+            Sequence[str]: Subreddit names to fetch data from
         """
         config = self.config
         
@@ -62,13 +157,14 @@ class DataFetcher:
         if config["use_dynamic_discovery"]:
             logger.info("Using dynamic subreddit discovery for production")
             try:
-                popular_subreddits = self.reddit_client.get_popular_subreddits(
-                    limit=config["dynamic_subreddit_count"]
+                popular_subreddits = await self.reddit_client.get_popular_subreddits(
+                    limit=config["dynamic_subreddit_count"],
+                    force_refresh=self.force_refresh
                 )
-                logger.info(f"Successfully discovered {len(popular_subreddits)} popular subreddits")
+                logger.info("Successfully discovered %d popular subreddits", len(popular_subreddits))
                 return popular_subreddits
             except Exception as e:
-                logger.error(f"Failed to fetch popular subreddits dynamically: {str(e)}")
+                logger.error("Failed to fetch popular subreddits dynamically: %s", e)
                 logger.info("Falling back to static subreddit list")
                 return get_target_subreddits()
         else:
@@ -76,62 +172,54 @@ class DataFetcher:
             logger.info("Using static production subreddit list")
             return get_target_subreddits()
     
-    def fetch_all_data(self) -> Dict[str, Any]:
+    async def fetch_all_data(self, output_path: Optional[str] = None) -> Dict[str, Any]:
         """
-        Fetch data from all configured subreddits.
+        Fetch data from all configured subreddits concurrently.
+        
+        Args:
+            output_path: Optional NDJSON file path. When given, each subreddit's
+                         data is written to it as one line as soon as it completes
+                         and is not kept in memory. Paths ending in ``.gz`` are
+                         gzip-compressed.
         
         Returns:
-            Dict containing all collected data with metadata
+            Dict containing all collected data with metadata. When streaming to
+            ``output_path``, the ``subreddits`` key is replaced by ``output_path``.
         """
         start_time = datetime.now()
+        batch_timestamp = start_time.isoformat()
+        target_subreddits = await self.load_target_subreddits()
         logger.info("Starting data fetching process...")
-        logger.info(f"Target subreddits: {', '.join(self.target_subreddits)}")
+        logger.info("Target subreddits: %s", ", ".join(target_subreddits))
         
         collected_data = {
             "metadata": {
-                "fetch_timestamp": start_time.isoformat(),
-                "total_subreddits": len(self.target_subreddits),
-                "config": self.config,
-                "subreddit_list": self.target_subreddits.copy()
+                "fetch_timestamp": batch_timestamp,
+                "total_subreddits": len(target_subreddits),
+                "config": dict(self.config),
+                "subreddit_list": list(target_subreddits)
             },
             "subreddits": {},
-            "summary": {
-                "successful_subreddits": 0,
-                "failed_subreddits": 0,
-                "total_posts": 0,
-                "total_comments": 0,
-                "errors": []
-            }
+            "summary": _new_summary()
         }
         
-        # Fetch data from each subreddit
-        for i, subreddit_name in enumerate(self.target_subreddits, 1):
-            logger.info(f"[{i}/{len(self.target_subreddits)}] Fetching r/{subreddit_name}...")
-            
-            try:
-                subreddit_data = self._fetch_subreddit_data(subreddit_name)
-                collected_data["subreddits"][subreddit_name] = subreddit_data
-                collected_data["summary"]["successful_subreddits"] += 1
-                collected_data["summary"]["total_posts"] += len(subreddit_data["posts"])
-                collected_data["summary"]["total_comments"] += sum(
-                    len(post["comments"]) for post in subreddit_data["posts"]
-                )
-                
-                logger.info(f"✓ Completed r/{subreddit_name}: {len(subreddit_data['posts'])} posts, "
-                           f"{sum(len(post['comments']) for post in subreddit_data['posts'])} comments")
-                
-            except Exception as e:
-                error_msg = f"Failed to fetch r/{subreddit_name}: {str(e)}"
-                logger.error(error_msg)
-                collected_data["summary"]["failed_subreddits"] += 1
-                collected_data["summary"]["errors"].append({
-                    "subreddit": subreddit_name,
-                    "error": str(e)
-                })
-            
-            # Rate limiting delay
-            if i < len(self.target_subreddits):  # Don't delay after the last subreddit
-                time.sleep(self.config["request_delay"])
+        if output_path:
+            del collected_data["subreddits"]
+            collected_data["output_path"] = output_path
+        
+        # Fetch data from all subreddits concurrently, handling each as it completes
+        summary = collected_data["summary"]
+        output_file = open_output(output_path) if output_path else None
+        try:
+            async for subreddit_data in self.iter_subreddits(summary, fetch_timestamp=batch_timestamp):
+                if output_file:
+                    # Serialize and write off the event loop so fetching continues meanwhile
+                    await asyncio.to_thread(_write_ndjson_record, output_file, subreddit_data)
+                else:
+                    collected_data["subreddits"][subreddit_data["name"]] = subreddit_data
+        finally:
+            if output_file:
+                output_file.close()
         
         # Finalize metadata
         end_time = datetime.now()
@@ -140,127 +228,371 @@ class DataFetcher:
         collected_data["metadata"]["fetch_completed_at"] = end_time.isoformat()
         
         # Log summary
-        summary = collected_data["summary"]
+        total = len(target_subreddits)
         logger.info("\n" + "=" * 60)
         logger.info("DATA FETCHING COMPLETED")
         logger.info("=" * 60)
-        logger.info(f"Duration: {duration:.2f} seconds")
-        logger.info(f"Successful subreddits: {summary['successful_subreddits']}/{len(self.target_subreddits)}")
-        logger.info(f"Total posts collected: {summary['total_posts']}")
-        logger.info(f"Total comments collected: {summary['total_comments']}")
+        logger.info("Duration: %.2f seconds", duration)
+        logger.info("Successful subreddits: %d/%d", summary["successful_subreddits"], total)
+        logger.info("Total posts collected: %d", summary["total_posts"])
+        logger.info("Total comments collected: %d", summary["total_comments"])
         if summary["errors"]:
-            logger.warning(f"Failed subreddits: {len(summary['errors'])}")
+            logger.warning("Failed subreddits: %d", len(summary["errors"]))
             for error in summary["errors"]:
-                logger.warning(f"  - r/{error['subreddit']}: {error['error']}")
+                logger.warning("  - r/%s: %s", error["subreddit"], error["error"])
         logger.info("=" * 60)
         
         return collected_data
     
-    def _fetch_subreddit_data(self, subreddit_name: str) -> Dict[str, Any]:
+    async def iter_subreddits(
+        self,
+        summary: Optional[Dict[str, Any]] = None,
+        fetch_timestamp: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch all target subreddits concurrently and yield each one's data as it completes.
+        
+        The caller only needs to hold one subreddit's data at a time, so records
+        can be written out while the remaining fetches continue. Failed
+        subreddits are logged, recorded in ``summary`` and skipped.
+        
+        Args:
+            summary: Optional summary dict whose counters and errors are updated
+                     as subreddits complete
+            fetch_timestamp: ISO timestamp of the fetch batch. Defaults to the
+                             current time.
+            
+        Yields:
+            Dict containing one subreddit's data including posts and comments
+        """
+        if summary is None:
+            summary = _new_summary()
+        fetch_timestamp = fetch_timestamp or datetime.now().isoformat()
+        target_subreddits = await self.load_target_subreddits()
+        
+        # Preload subreddit info in bulk so each subreddit skips its own info request
+        info_map, hot_posts_map = await asyncio.gather(
+            self.reddit_client.get_subreddits_info_bulk(
+                target_subreddits,
+                force_refresh=self.force_refresh
+            ),
+            self._preload_hot_posts(target_subreddits),
+            return_exceptions=True
+        )
+        if isinstance(info_map, Exception):
+            logger.warning("Could not preload subreddit info, fetching individually: %s", info_map)
+            info_map = {}
+        if isinstance(hot_posts_map, Exception):
+            logger.warning("Could not preload hot posts, fetching individually: %s", hot_posts_map)
+            hot_posts_map = {}
+        
+        total = len(target_subreddits)
+        pending = {
+            asyncio.ensure_future(self._fetch_subreddit_data_paced(
+                subreddit_name, i, total, fetch_timestamp,
+                info_map.get(subreddit_name), hot_posts_map.get(subreddit_name)
+            )): subreddit_name
+            for i, subreddit_name in enumerate(target_subreddits, 1)
+        }
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    subreddit_name = pending.pop(task)
+                    try:
+                        subreddit_data = task.result()
+                    except Exception as e:
+                        logger.error("Failed to fetch r/%s: %s", subreddit_name, e)
+                        summary["failed_subreddits"] += 1
+                        summary["errors"].append({
+                            "subreddit": subreddit_name,
+                            "error": str(e)
+                        })
+                        continue
+                    
+                    post_count = subreddit_data["post_count"]
+                    comment_count = subreddit_data["comment_count"]
+                    summary["successful_subreddits"] += 1
+                    summary["total_posts"] += post_count
+                    summary["total_comments"] += comment_count
+                    logger.info("✓ Completed r/%s: %d posts, %d comments", subreddit_name, post_count, comment_count)
+                    
+                    yield subreddit_data
+        finally:
+            # Stop the remaining fetches if the caller stops iterating early
+            for task in pending:
+                task.cancel()
+    
+    async def _preload_hot_posts(self, target_subreddits: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch hot posts for groups of subreddits with multireddit requests.
+        
+        Only used when ``multireddit_preload`` is enabled. Subreddits are
+        grouped so that each group's posts fit in one listing page. Because a
+        multireddit listing is ranked as a whole, only subreddits that
+        received a full set of posts are returned; the rest (and any group
+        whose request failed) are fetched individually. Multireddit listings
+        leave out stickied posts, so the preloaded subreddits' posts do not
+        include them.
+        
+        Args:
+            target_subreddits: Names of the subreddits to preload
+            
+        Returns:
+            Dict mapping subreddit names to their raw hot post dicts
+        """
+        post_limit = self.config["posts_per_subreddit"]
+        if not self.config["multireddit_preload"] or not 0 < post_limit <= MAX_LISTING_LIMIT:
+            return {}
+        
+        chunk_size = min(MULTIREDDIT_CHUNK_SIZE, MAX_LISTING_LIMIT // post_limit)
+        if chunk_size < 2:
+            return {}
+        
+        chunks = [
+            target_subreddits[i:i + chunk_size]
+            for i in range(0, len(target_subreddits), chunk_size)
+        ]
+        results = await asyncio.gather(
+            *[self.reddit_client.get_hot_posts_multi(chunk, limit_per_subreddit=post_limit) for chunk in chunks],
+            return_exceptions=True
+        )
+        
+        hot_posts_map = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.warning("Could not preload hot posts for %s: %s", "+".join(chunk), result)
+                continue
+            for subreddit_name, posts in result.items():
+                if len(posts) >= post_limit:
+                    hot_posts_map[subreddit_name] = posts
+        
+        logger.info("Preloaded hot posts for %d of %d subreddits in %d requests",
+                    len(hot_posts_map), len(target_subreddits), len(chunks))
+        return hot_posts_map
+    
+    async def _fetch_subreddit_data_paced(
+        self,
+        subreddit_name: str,
+        position: int,
+        total: int,
+        fetch_timestamp: str,
+        subreddit_info: Optional[Dict[str, Any]] = None,
+        hot_posts: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single subreddit while holding a concurrency slot.
+        
+        Requests themselves are paced by the Reddit client from the rate limit
+        headers of its responses, so no fixed delay is added between fetches.
+        
+        Args:
+            subreddit_name: Name of the subreddit to fetch from
+            position: 1-based position of the subreddit in the target list
+            total: Total number of target subreddits
+            fetch_timestamp: ISO timestamp of the fetch batch
+            subreddit_info: Optional preloaded subreddit info
+            hot_posts: Optional preloaded hot posts
+            
+        Returns:
+            Dict containing subreddit data including posts and comments
+        """
+        async with self._subreddit_semaphore:
+            logger.info("[%d/%d] Fetching r/%s...", position, total, subreddit_name)
+            return await self._fetch_subreddit_data(
+                subreddit_name,
+                fetch_timestamp=fetch_timestamp,
+                subreddit_info=subreddit_info,
+                hot_posts=hot_posts
+            )
+    
+    async def _fetch_subreddit_data(
+        self,
+        subreddit_name: str,
+        fetch_timestamp: Optional[str] = None,
+        subreddit_info: Optional[Dict[str, Any]] = None,
+        hot_posts: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Fetch data from a single subreddit.
         
         Args:
             subreddit_name: Name of the subreddit to fetch from
+            fetch_timestamp: ISO timestamp shared by the whole fetch batch.
+                             Defaults to the current time.
+            subreddit_info: Preloaded subreddit info. When given, the info
+                            request for this subreddit is skipped.
+            hot_posts: Preloaded raw hot post dicts. When given, the hot
+                       listing request for this subreddit is skipped.
             
         Returns:
             Dict containing subreddit data including posts and comments
         """
         subreddit_data = {
             "name": subreddit_name,
-            "fetch_timestamp": datetime.now().isoformat(),
-            "info": {},
-            "posts": []
+            "fetch_timestamp": fetch_timestamp or datetime.now().isoformat(),
+            "info": subreddit_info or {},
+            "posts": [],
+            "post_count": 0,
+            "comment_count": 0
         }
         
-        # Get subreddit info
-        try:
-            subreddit_info = self.reddit_client.get_subreddit_info(subreddit_name)
-            subreddit_data["info"] = subreddit_info
-        except Exception as e:
-            logger.warning(f"Could not fetch info for r/{subreddit_name}: {str(e)}")
-        
-        # Get hot posts
-        posts = self.reddit_client.get_hot_posts(
-            subreddit_name, 
-            limit=self.config["posts_per_subreddit"]
-        )
-        
-        # Process each post and its comments
-        for post in posts:
-            post_data = self._extract_post_data(post)
-            
-            # Get comments for this post
+        # Get subreddit info unless it was preloaded
+        if subreddit_info is None:
             try:
-                comments = self.reddit_client.get_top_comments(
-                    post, 
-                    limit=self.config["comments_per_post"]
+                subreddit_info = await self.reddit_client.get_subreddit_info(
+                    subreddit_name,
+                    force_refresh=self.force_refresh
                 )
-                post_data["comments"] = [
-                    self._extract_comment_data(comment) for comment in comments
-                ]
+                subreddit_data["info"] = subreddit_info
             except Exception as e:
-                logger.warning(f"Could not fetch comments for post {post.id}: {str(e)}")
-                post_data["comments"] = []
+                logger.warning("Could not fetch info for r/%s: %s", subreddit_name, e)
+        
+        # Get hot posts unless they were preloaded, with a single JSON request
+        # when they fit in one page
+        post_limit = self.config["posts_per_subreddit"]
+        if hot_posts is not None:
+            posts = hot_posts
+        elif post_limit <= MAX_LISTING_LIMIT:
+            posts = await self.reddit_client.get_hot_posts_fast(subreddit_name, limit=post_limit)
+        else:
+            posts = await self.reddit_client.get_hot_posts(subreddit_name, limit=post_limit)
+        
+        # Fetch comments for all posts concurrently
+        comment_results = await asyncio.gather(
+            *[self._fetch_and_extract_comments(post) for post in posts],
+            return_exceptions=True
+        )
+        
+        # Process each post and its comments
+        for post, comments in zip(posts, comment_results):
+            if isinstance(comments, Exception):
+                logger.warning("Could not fetch comments for post %s: %s", _fields(post)["id"], comments)
+                comments = []
             
-            subreddit_data["posts"].append(post_data)
+            subreddit_data["posts"].append(self._extract_post_data(post, comments))
+            subreddit_data["comment_count"] += len(comments)
         
+        subreddit_data["post_count"] = len(subreddit_data["posts"])
         return subreddit_data
     
-    def _extract_post_data(self, post) -> Dict[str, Any]:
+    async def _fetch_and_extract_comments(self, post) -> List[Comment]:
+        """
+        Fetch the top comments for a post and extract their data.
+        
+        Comment requests share a semaphore across all subreddits so the total
+        number of in-flight comment fetches stays within Reddit's rate limits.
+        Requests for up to one page of comments use the single-request JSON
+        path; larger ones fall back to Async PRAW's comment tree.
+        
+        Args:
+            post: Async PRAW Submission object, or the raw post dict returned
+                  by ``get_hot_posts_fast``
+            
+        Returns:
+            List of extracted Comment records
+        """
+        limit = self.config["comments_per_post"]
+        d = _fields(post)
+        async with self._comment_semaphore:
+            if limit <= MAX_LISTING_LIMIT:
+                comments = await self.reddit_client.get_top_comments_fast(
+                    d["id"],
+                    str(d["subreddit"]),
+                    limit=limit
+                )
+            else:
+                comments = await self.reddit_client.get_top_comments(
+                    d["id"] if isinstance(post, dict) else post,
+                    limit=limit
+                )
+        return [self._extract_comment_data(comment) for comment in comments]
+    
+    def _extract_post_data(self, post, comments: Optional[List[Comment]] = None) -> Post:
         """
         Extract relevant data from a Reddit post.
         
+        Fields are read from the attributes already loaded on the submission,
+        so a field missing from Reddit's response becomes None instead of
+        triggering a lazy fetch.
+        
         Args:
-            post: PRAW Submission object
+            post: Async PRAW Submission object, or the raw post dict returned
+                  by ``get_hot_posts_fast``
+            comments: Extracted top comments of the post (default: none)
             
         Returns:
-            Dict containing extracted post data
+            Post record containing the extracted post data
         """
-        return {
-            "id": post.id,
-            "title": post.title,
-            "author": str(post.author) if post.author else "[deleted]",
-            "score": post.score,
-            "upvote_ratio": post.upvote_ratio,
-            "num_comments": post.num_comments,
-            "created_utc": post.created_utc,
-            "url": post.url,
-            "permalink": f"https://reddit.com{post.permalink}",
-            "selftext": post.selftext,
-            "is_self": post.is_self,
-            "domain": post.domain,
-            "subreddit": str(post.subreddit),
-            "gilded": post.gilded,
-            "stickied": post.stickied,
-            "over_18": post.over_18,
-            "spoiler": post.spoiler,
-            "locked": post.locked
-        }
+        d = _fields(post)
+        author = d.get("author")
+        return Post(
+            id=d["id"],
+            title=d.get("title"),
+            author=str(author) if author else "[deleted]",
+            score=d.get("score"),
+            upvote_ratio=d.get("upvote_ratio"),
+            num_comments=d.get("num_comments"),
+            created_utc=d.get("created_utc"),
+            url=d.get("url"),
+            permalink=f"https://reddit.com{d.get('permalink', '')}",
+            selftext=d.get("selftext"),
+            is_self=d.get("is_self"),
+            domain=d.get("domain"),
+            subreddit=str(d.get("subreddit")),
+            gilded=d.get("gilded"),
+            stickied=d.get("stickied"),
+            over_18=d.get("over_18"),
+            spoiler=d.get("spoiler"),
+            locked=d.get("locked"),
+            comments=comments if comments is not None else []
+        )
     
-    def _extract_comment_data(self, comment) -> Dict[str, Any]:
+    def _extract_comment_data(self, comment) -> Comment:
         """
         Extract relevant data from a Reddit comment.
         
+        Fields are read from the attributes already loaded on the comment,
+        like in ``_extract_post_data``.
+        
         Args:
-            comment: PRAW Comment object
+            comment: Async PRAW Comment object, or the raw comment dict
+                     returned by ``get_top_comments_fast``
             
         Returns:
-            Dict containing extracted comment data
+            Comment record containing the extracted comment data
         """
-        return {
-            "id": comment.id,
-            "author": str(comment.author) if comment.author else "[deleted]",
-            "body": comment.body,
-            "score": comment.score,
-            "created_utc": comment.created_utc,
-            "gilded": comment.gilded,
-            "is_submitter": comment.is_submitter,
-            "stickied": comment.stickied,
-            "permalink": f"https://reddit.com{comment.permalink}",
-            "parent_id": comment.parent_id,
-            "depth": comment.depth if hasattr(comment, 'depth') else 0
-        }
+        d = _fields(comment)
+        author = d.get("author")
+        return Comment(
+            id=d["id"],
+            author=str(author) if author else "[deleted]",
+            body=d.get("body"),
+            score=d.get("score"),
+            created_utc=d.get("created_utc"),
+            gilded=d.get("gilded"),
+            is_submitter=d.get("is_submitter"),
+            stickied=d.get("stickied"),
+            permalink=f"https://reddit.com{d.get('permalink', '')}",
+            parent_id=d.get("parent_id"),
+            depth=d.get("depth", 0)
+        )
+
+
+async def collect_data(force_refresh: bool = False, output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a full data fetching pass and release the Reddit client afterwards.
+    
+    Args:
+        force_refresh: Bypass the response cache and always fetch fresh data
+        output_path: Optional NDJSON file to stream subreddit data to
+        
+    Returns:
+        Dict containing all collected data with metadata
+    """
+    async with DataFetcher(force_refresh=force_refresh) as fetcher:
+        return await fetcher.fetch_all_data(output_path=output_path)
 
 
 def main():
@@ -268,14 +600,13 @@ def main():
     Main function to run the data fetching process.
     """
     try:
-        fetcher = DataFetcher()
-        data = fetcher.fetch_all_data()
+        data = asyncio.run(collect_data())
         
         logger.info("Data fetching completed successfully!")
         return data
         
     except Exception as e:
-        logger.error(f"Data fetching failed: {str(e)}")
+        logger.error("Data fetching failed: %s", e)
         raise
 
 
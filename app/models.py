@@ -0,0 +1,58 @@
+"""
+Data Models
+
+This module defines the post and comment records produced by the data fetching
+process. Records are immutable slotted dataclasses, which orjson serializes
+natively when the collected data is written out.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Comment:
+    """
+    A Reddit comment.
+    
+    Only ``id`` is required; fields Reddit leaves out of a response are None.
+    """
+    id: str
+    author: Optional[str] = None
+    body: Optional[str] = None
+    score: Optional[int] = None
+    created_utc: Optional[float] = None
+    gilded: Optional[int] = None
+    is_submitter: Optional[bool] = None
+    stickied: Optional[bool] = None
+    permalink: Optional[str] = None
+    parent_id: Optional[str] = None
+    depth: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class Post:
+    """
+    A Reddit post together with its collected top comments.
+    
+    Only ``id`` is required; fields Reddit leaves out of a response are None.
+    """
+    id: str
+    title: Optional[str] = None
+    author: Optional[str] = None
+    score: Optional[int] = None
+    upvote_ratio: Optional[float] = None
+    num_comments: Optional[int] = None
+    created_utc: Optional[float] = None
+    url: Optional[str] = None
+    permalink: Optional[str] = None
+    selftext: Optional[str] = None
+    is_self: Optional[bool] = None
+    domain: Optional[str] = None
+    subreddit: Optional[str] = None
+    gilded: Optional[int] = None
+    stickied: Optional[bool] = None
+    over_18: Optional[bool] = None
+    spoiler: Optional[bool] = None
+    locked: Optional[bool] = None
+    comments: List[Comment] = field(default_factory=list)
@@ -0,0 +1,66 @@
+"""
+Request Rate Limiting
+
+This module provides an asyncio rate limiter driven by the rate limit headers
+Reddit returns with every response, shared by all concurrent requests.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class RedditRateLimiter:
+    """
+    Paces requests using Reddit's ``X-Ratelimit-*`` response headers.
+    
+    Requests go out immediately while plenty of quota is left in the current
+    window. Once fewer than ``min_remaining`` requests remain, the rest of the
+    window is spread evenly over the remaining quota, and an exhausted quota
+    waits for the window to reset.
+    """
+    
+    def __init__(self, min_remaining: float = 5):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            min_remaining: Remaining-request count below which requests are spaced out
+        """
+        self.min_remaining = min_remaining
+        self.remaining: Optional[float] = None
+        self.reset_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    def update(self, remaining: Optional[str], reset: Optional[str]) -> None:
+        """
+        Record the quota reported by a response.
+        
+        Args:
+            remaining: Value of the ``X-Ratelimit-Remaining`` header
+            reset: Value of the ``X-Ratelimit-Reset`` header (seconds until reset)
+        """
+        if remaining is None or reset is None:
+            return
+        self.remaining = float(remaining)
+        self.reset_at = time.monotonic() + float(reset)
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a request may be sent and count it against the quota.
+        
+        Waiters are served in arrival order.
+        """
+        async with self._lock:
+            if self.remaining is None:
+                return
+            
+            now = time.monotonic()
+            if now >= self.reset_at:
+                # The window has reset; the next response reports the new quota
+                self.remaining = None
+                return
+            
+            if self.remaining < self.min_remaining:
+                await asyncio.sleep((self.reset_at - now) / max(self.remaining, 1))
+            self.remaining -= 1
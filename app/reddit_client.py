@@ -2,49 +2,208 @@
 Reddit API Client Service
 
 This module provides a dedicated, reusable interface for all interactions with the Reddit API.
-It abstracts PRAW-specific logic and provides clear methods for fetching posts and comments.
+It abstracts Async PRAW-specific logic and provides clear methods for fetching posts and comments.
 """
 
-from typing import List, Optional
-import praw
-from praw.models import Submission, Comment
-from .config import CLIENT_ID, CLIENT_SECRET, USER_AGENT
+import asyncio
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Union
+import aiohttp
+import asyncpraw
+from asyncpraw.models import Submission, Comment
+from .cache import TTLCache
+from .config import get_config
+from .rate_limiter import RedditRateLimiter
+from .settings import get_cache_config, get_fetching_config
+
+
+# Base URL for Reddit's public JSON listing endpoints
+REDDIT_JSON_URL = "https://www.reddit.com"
+
+# Reddit returns at most this many items per listing request
+MAX_LISTING_LIMIT = 100
+
+# Response statuses worth retrying, and the base delay (in seconds) of the
+# exponential backoff between retries
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_BASE = 1.0
+
+# Subreddits whose names contain any of these keywords are excluded from discovery
+_EXCLUDED_RE = re.compile(
+    r"nsfw|porn|sex|xxx|adult|onlyfans|gone|wild|circlejerk|jerk|shitpost|copypasta"
+)
+
+
+def create_connector() -> aiohttp.TCPConnector:
+    """
+    Create a connector for raw Reddit JSON requests.
+    
+    Pass one connector to several ``RedditClient`` instances in a long-lived
+    process to share keep-alive connections and DNS lookups between them.
+    Must be called inside a running event loop.
+    
+    Returns:
+        aiohttp.TCPConnector: A pooled connector with DNS caching
+    """
+    return aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
 
 
 class RedditClient:
     """
-    A client for interacting with the Reddit API using PRAW.
+    A client for interacting with the Reddit API using Async PRAW.
     
-    This class handles authentication and provides methods for fetching
-    posts and comments from Reddit subreddits.
+    This class handles authentication and provides coroutine methods for
+    fetching posts and comments from Reddit subreddits. Call ``close()`` (or
+    use the client as an async context manager) when done so the underlying
+    HTTP session is released.
     """
     
-    def __init__(self):
+    def __init__(self, connector: Optional[aiohttp.BaseConnector] = None):
         """
         Initialize the Reddit client with credentials from environment variables.
         
+        Args:
+            connector: Optional aiohttp connector for raw JSON requests. Clients
+                       given the same connector share its keep-alive connections
+                       and DNS cache; it is left open by ``close()``.
+        
         Raises:
             ValueError: If any required credentials are missing.
         """
-        if not all([CLIENT_ID, CLIENT_SECRET, USER_AGENT]):
-            raise ValueError("Missing required Reddit API credentials")
+        config = get_config()
+        self.user_agent = config.user_agent
         
-        self.reddit = praw.Reddit(
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            user_agent=USER_AGENT
+        self.reddit = asyncpraw.Reddit(
+            client_id=config.client_id,
+            client_secret=config.client_secret,
+            user_agent=config.user_agent
         )
+        # Only public content is read, so no user authentication is needed
+        self.reddit.read_only = True
         
-        # Test the connection by accessing a simple property
-        try:
-            # This will raise an exception if credentials are invalid
-            self.reddit.user.me()
-        except Exception:
-            # For read-only access, we don't need authentication
-            # The client should still work for public content
-            pass
+        self.cache_config = get_cache_config()
+        self._cache = TTLCache(self.cache_config["directory"])
+        
+        fetching_config = get_fetching_config()
+        self.max_retries = fetching_config["max_retries"]
+        self.request_timeout = fetching_config["request_timeout"]
+        
+        # Shared keep-alive session for raw JSON requests. It is created lazily
+        # because aiohttp sessions must be created inside a running event loop.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector = connector
+        
+        # Quota tracking shared by all concurrent JSON requests (Async PRAW
+        # throttles its own requests from the same headers)
+        self._rate_limiter = RedditRateLimiter()
+    
+    async def __aenter__(self) -> "RedditClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the underlying Reddit HTTP sessions.
+        """
+        if self._session is not None:
+            await self._session.close()
+        await self.reddit.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        The session keeps a pool of keep-alive connections and caches DNS
+        lookups, so TLS handshakes are amortized over all JSON requests.
+        
+        Returns:
+            aiohttp.ClientSession: The shared session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=self._connector or create_connector(),
+                connector_owner=self._connector is None,
+                headers={"User-Agent": self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        return self._session
+    
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Fetch and decode a public Reddit JSON endpoint in a single request.
+        
+        The request waits on the shared rate limiter, which is updated from
+        the rate limit headers of every response. Rate limited (429) and
+        server error responses are retried up to ``max_retries`` times with
+        exponential backoff, waiting at least as long as the response's
+        ``Retry-After`` header asks. Redirects are not followed: Reddit
+        redirects listings of subreddits that do not exist to a search page.
+        
+        Args:
+            path (str): Endpoint path, e.g. '/subreddits/popular.json'
+            params (dict): Optional query string parameters
+            
+        Returns:
+            Any: The decoded JSON response body
+            
+        Raises:
+            aiohttp.ClientError: If the request fails, is redirected or returns
+                an error status
+        """
+        session = self._get_session()
+        for attempt in range(self.max_retries + 1):
+            await self._rate_limiter.acquire()
+            async with session.get(f"{REDDIT_JSON_URL}{path}", params=params, allow_redirects=False) as response:
+                self._rate_limiter.update(
+                    response.headers.get("X-Ratelimit-Remaining"),
+                    response.headers.get("X-Ratelimit-Reset")
+                )
+                if 300 <= response.status < 400:
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=f"Redirected to {response.headers.get('Location')}",
+                        headers=response.headers
+                    )
+                if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return await response.json()
+                retry_after = response.headers.get("Retry-After")
+            
+            delay = RETRY_BACKOFF_BASE * 2 ** attempt
+            if retry_after is not None and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+    
+    async def _get_popular_listing(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get the raw popular subreddits listing with one HTTP request.
+        
+        The listing already carries every field needed for filtering, so no
+        per-subreddit follow-up requests are made.
+        
+        Args:
+            limit (int): Number of listing entries to request (capped at 100)
+            
+        Returns:
+            List[dict]: The ``data`` dict of each subreddit in the listing
+        """
+        listing = await self._get_json(
+            "/subreddits/popular.json",
+            params={"limit": min(limit, MAX_LISTING_LIMIT)}
+        )
+        return [child["data"] for child in listing["data"]["children"]]
     
-    def get_hot_posts(self, subreddit_name: str, limit: int = 25) -> List[Submission]:
+    async def get_hot_posts(self, subreddit_name: str, limit: int = 25) -> List[Submission]:
         """
         Get the top hot posts from a specified subreddit.
         
@@ -59,18 +218,92 @@ class RedditClient:
             Exception: If the subreddit doesn't exist or is inaccessible
         """
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            hot_posts = list(subreddit.hot(limit=limit))
-            return hot_posts
+            subreddit = await self.reddit.subreddit(subreddit_name)
+            return [submission async for submission in subreddit.hot(limit=limit)]
+        except Exception as e:
+            raise Exception(f"Failed to fetch hot posts from r/{subreddit_name}: {str(e)}")
+    
+    async def get_hot_posts_fast(self, subreddit_name: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """
+        Get the top hot posts from a specified subreddit with a single JSON request.
+        
+        Only post (``t3``) entries of the listing are returned.
+        
+        Args:
+            subreddit_name (str): The name of the subreddit (without 'r/')
+            limit (int): The number of posts to retrieve (default: 25, max: 100)
+            
+        Returns:
+            List[dict]: The raw ``data`` dict of each post
+            
+        Raises:
+            Exception: If the subreddit doesn't exist or is inaccessible
+        """
+        try:
+            listing = await self._get_json(
+                f"/r/{subreddit_name}/hot.json",
+                params={"limit": min(limit, MAX_LISTING_LIMIT)}
+            )
         except Exception as e:
             raise Exception(f"Failed to fetch hot posts from r/{subreddit_name}: {str(e)}")
+        
+        posts = [child["data"] for child in listing["data"]["children"] if child.get("kind") == "t3"]
+        return posts[:limit]
+    
+    async def get_hot_posts_multi(
+        self,
+        subreddit_names: Sequence[str],
+        limit_per_subreddit: int = 25
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get hot posts from several subreddits with a single multireddit request.
+        
+        Reddit ranks the combined ``/r/a+b/hot`` listing as a whole, so busier
+        subreddits can take more than their share of it and a subreddit may
+        come back with fewer than ``limit_per_subreddit`` posts. Unlike a
+        single subreddit's listing, it does not include stickied posts.
+        
+        Args:
+            subreddit_names: Names of the subreddits (without 'r/')
+            limit_per_subreddit: Maximum number of posts to keep per subreddit
+            
+        Returns:
+            Dict mapping each requested name to the raw ``data`` dicts of its
+            posts, in hot order
+            
+        Raises:
+            Exception: If the listing request fails
+        """
+        multireddit = "+".join(subreddit_names)
+        try:
+            listing = await self._get_json(
+                f"/r/{multireddit}/hot.json",
+                params={"limit": min(limit_per_subreddit * len(subreddit_names), MAX_LISTING_LIMIT)}
+            )
+        except Exception as e:
+            raise Exception(f"Failed to fetch hot posts from r/{multireddit}: {str(e)}")
+        
+        posts: Dict[str, List[Dict[str, Any]]] = {name.lower(): [] for name in subreddit_names}
+        for child in listing["data"]["children"]:
+            if child.get("kind") != "t3":
+                continue
+            post = child["data"]
+            subreddit_posts = posts.get(str(post.get("subreddit", "")).lower())
+            if subreddit_posts is not None and len(subreddit_posts) < limit_per_subreddit:
+                subreddit_posts.append(post)
+        
+        return {name: posts[name.lower()] for name in subreddit_names}
     
-    def get_top_comments(self, post: Submission, limit: int = 50) -> List[Comment]:
+    async def get_top_comments(self, post: Union[Submission, str], limit: int = 50) -> List[Comment]:
         """
         Get the top comments from a Reddit post.
         
+        Posts that are not loaded yet are loaded with ``top`` comment sorting
+        and a comment limit, so the whole comment forest needed arrives in the
+        same request as the post.
+        
         Args:
-            post (Submission): A PRAW Submission object
+            post (Submission): A PRAW Submission object, or the ID of the post
             limit (int): The number of comments to retrieve (default: 50)
             
         Returns:
@@ -80,31 +313,119 @@ class RedditClient:
             Exception: If comments cannot be retrieved from the post
         """
         try:
-            # Ensure the submission object has comments loaded
-            post.comments.replace_more(limit=0)  # Remove "more comments" objects
+            if isinstance(post, str):
+                post = await self.reddit.submission(post, fetch=False)
+            # Listing submissions are lazy; load them with the top comments so
+            # no follow-up request is needed
+            if not post._fetched:
+                post.comment_sort = "top"
+                post.comment_limit = limit
+                await post.load()
+            await post.comments.replace_more(limit=0)  # Remove "more comments" objects
             
-            # Get all top-level comments and flatten nested comments
-            all_comments = []
-            comment_queue = list(post.comments)
+            # Get all top-level comments and flatten nested comments (breadth-first)
+            # into a buffer sized for the limit
+            all_comments = [None] * limit
+            count = 0
+            comment_queue = deque(post.comments)
             
-            while comment_queue and len(all_comments) < limit:
-                comment = comment_queue.pop(0)
+            while comment_queue and count < limit:
+                comment = comment_queue.popleft()
                 if isinstance(comment, Comment):
-                    all_comments.append(comment)
+                    all_comments[count] = comment
+                    count += 1
+                    if count >= limit:
+                        break
                     # Add replies to the queue for processing
                     comment_queue.extend(comment.replies)
             
-            return all_comments[:limit]
+            return all_comments[:count]
+            
+        except Exception as e:
+            raise Exception(f"Failed to fetch comments from post {getattr(post, 'id', post)}: {str(e)}")
+    
+    async def get_top_comments_fast(self, post_id: str, subreddit_name: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get the top comments from a Reddit post with a single JSON request.
+        
+        Unlike ``get_top_comments``, "load more comments" stubs are skipped
+        rather than expanded, so at most one round-trip is made per post. The
+        comment tree is flattened breadth-first like ``get_top_comments``.
+        
+        Args:
+            post_id (str): The ID of the post (without the 't3_' prefix)
+            subreddit_name (str): The name of the post's subreddit (without 'r/')
+            limit (int): The number of comments to retrieve (default: 50, max: 100)
+            
+        Returns:
+            List[dict]: The raw ``data`` dict of each comment
             
+        Raises:
+            Exception: If comments cannot be retrieved from the post
+        """
+        try:
+            _, comment_listing = await self._get_json(
+                f"/r/{subreddit_name}/comments/{post_id}.json",
+                params={"limit": min(limit, MAX_LISTING_LIMIT), "sort": "top"}
+            )
         except Exception as e:
-            raise Exception(f"Failed to fetch comments from post {post.id}: {str(e)}")
+            raise Exception(f"Failed to fetch comments from post {post_id}: {str(e)}")
+        
+        all_comments = [None] * limit
+        count = 0
+        comment_queue = deque(comment_listing["data"]["children"])
+        
+        while comment_queue and count < limit:
+            child = comment_queue.popleft()
+            if child["kind"] != "t1":  # Skip "more comments" stubs
+                continue
+            comment = child["data"]
+            all_comments[count] = comment
+            count += 1
+            if count >= limit:
+                break
+            # Replies are an empty string when a comment has none
+            if comment.get("replies"):
+                comment_queue.extend(comment["replies"]["data"]["children"])
+        
+        return all_comments[:count]
+    
+    def _get_cached(self, key: str, ttl_key: str, force_refresh: bool) -> Optional[Any]:
+        """
+        Look up a cached response unless caching is disabled or bypassed.
+        
+        Args:
+            key (str): The cache key
+            ttl_key (str): Name of the cache config entry holding the TTL
+            force_refresh (bool): Whether to bypass the cache
+            
+        Returns:
+            Any: The cached value, or None if it must be fetched
+        """
+        if force_refresh or not self.cache_config["enabled"]:
+            return None
+        return self._cache.get(key, self.cache_config[ttl_key])
+    
+    def _set_cached(self, key: str, value: Any) -> None:
+        """
+        Store a response in the cache if caching is enabled.
+        
+        Args:
+            key (str): The cache key
+            value (Any): JSON-serializable value to store
+        """
+        if self.cache_config["enabled"]:
+            self._cache.set(key, value)
     
-    def get_subreddit_info(self, subreddit_name: str) -> dict:
+    async def get_subreddit_info(self, subreddit_name: str, force_refresh: bool = False) -> dict:
         """
         Get basic information about a subreddit.
         
+        Results are cached on disk for ``subreddit_info_ttl`` seconds.
+        
         Args:
             subreddit_name (str): The name of the subreddit (without 'r/')
+            force_refresh (bool): Bypass the cache and fetch fresh data (default: False)
             
         Returns:
             dict: Basic information about the subreddit
@@ -112,9 +433,14 @@ class RedditClient:
         Raises:
             Exception: If the subreddit doesn't exist or is inaccessible
         """
+        cache_key = f"subreddit_info:{subreddit_name.lower()}"
+        cached = self._get_cached(cache_key, "subreddit_info_ttl", force_refresh)
+        if cached is not None:
+            return cached
+        
         try:
-            subreddit = self.reddit.subreddit(subreddit_name)
-            return {
+            subreddit = await self.reddit.subreddit(subreddit_name, fetch=True)
+            subreddit_info = {
                 'name': subreddit.display_name,
                 'title': subreddit.title,
                 'description': subreddit.description,
@@ -125,13 +451,80 @@ class RedditClient:
             }
         except Exception as e:
             raise Exception(f"Failed to fetch subreddit info for r/{subreddit_name}: {str(e)}")
+        
+        self._set_cached(cache_key, subreddit_info)
+        return subreddit_info
+    
+    async def get_subreddits_info_bulk(
+        self,
+        subreddit_names: Sequence[str],
+        force_refresh: bool = False
+    ) -> Dict[str, dict]:
+        """
+        Get basic information about many subreddits with as few requests as possible.
+        
+        Subreddits missing from the cache are looked up through ``/api/info.json``,
+        which returns up to 100 subreddits per request. Results share the cache
+        entries used by ``get_subreddit_info``.
+        
+        Args:
+            subreddit_names (Sequence[str]): Names of the subreddits (without 'r/')
+            force_refresh (bool): Bypass the cache and fetch fresh data (default: False)
+            
+        Returns:
+            Dict[str, dict]: Subreddit info keyed by the requested name. Subreddits
+            that Reddit did not return (banned, private, misspelled) are omitted.
+            
+        Raises:
+            Exception: If a bulk info request fails
+        """
+        info_map = {}
+        missing = []
+        for name in subreddit_names:
+            cached = self._get_cached(f"subreddit_info:{name.lower()}", "subreddit_info_ttl", force_refresh)
+            if cached is not None:
+                info_map[name] = cached
+            else:
+                missing.append(name)
+        
+        requested = {name.lower(): name for name in missing}
+        try:
+            for start in range(0, len(missing), MAX_LISTING_LIMIT):
+                chunk = missing[start:start + MAX_LISTING_LIMIT]
+                listing = await self._get_json("/api/info.json", params={"sr_name": ",".join(chunk)})
+                
+                for child in listing["data"]["children"]:
+                    data = child["data"]
+                    name = requested.get(data["display_name"].lower())
+                    if name is None:
+                        continue
+                    subreddit_info = {
+                        'name': data["display_name"],
+                        'title': data.get("title"),
+                        'description': data.get("description"),
+                        'subscribers': data.get("subscribers"),
+                        'created_utc': data.get("created_utc"),
+                        'public_description': data.get("public_description"),
+                        'over18': data.get("over18")
+                    }
+                    self._set_cached(f"subreddit_info:{name.lower()}", subreddit_info)
+                    info_map[name] = subreddit_info
+        except Exception as e:
+            raise Exception(f"Failed to fetch subreddit info in bulk: {str(e)}")
+        
+        return info_map
     
-    def get_popular_subreddits(self, limit: int = 50) -> List[str]:
+    async def get_popular_subreddits(self, limit: int = 50, force_refresh: bool = False) -> List[str]:
         """
         Get the most popular subreddits from Reddit.
         
+        A full page of the popular listing is filtered and cached on disk for
+        ``popular_subreddits_ttl`` seconds, so calls with different limits
+        share one cached listing.
+        
         Args:
             limit (int): Number of popular subreddits to retrieve (default: 50)
+            force_refresh (bool): Bypass the cache and fetch fresh data (default: False)
             
         Returns:
             List[str]: List of subreddit names sorted by popularity
@@ -139,41 +532,41 @@ class RedditClient:
         Raises:
             Exception: If popular subreddits cannot be retrieved
         """
+        cache_key = "popular_subreddits"
+        cached = self._get_cached(cache_key, "popular_subreddits_ttl", force_refresh)
+        if cached is not None:
+            return cached[:limit]
+        
         try:
-            popular_subreddits = list(self.reddit.subreddits.popular(limit=limit * 2))  # Get more to filter
+            # A full page costs the same single request and leaves room to filter
+            popular_subreddits = await self._get_popular_listing(MAX_LISTING_LIMIT)
             
             # Filter out NSFW and problematic subreddits
             filtered_subreddits = []
-            excluded_keywords = {
-                'nsfw', 'porn', 'sex', 'xxx', 'adult', 'onlyfans', 'gone', 'wild',
-                'circlejerk', 'jerk', 'shitpost', 'copypasta'
-            }
             
             for subreddit in popular_subreddits:
                 # Skip NSFW subreddits
-                if subreddit.over18:
+                if subreddit.get("over18"):
                     continue
                     
                 # Skip subreddits with problematic keywords
-                subreddit_name_lower = subreddit.display_name.lower()
-                if any(keyword in subreddit_name_lower for keyword in excluded_keywords):
+                if _EXCLUDED_RE.search(subreddit["display_name"].lower()):
                     continue
                     
                 # Skip subreddits with very few subscribers (likely spam/inactive)
-                if subreddit.subscribers and subreddit.subscribers < 10000:
+                subscribers = subreddit.get("subscribers")
+                if subscribers and subscribers < 10000:
                     continue
                     
-                filtered_subreddits.append(subreddit.display_name)
-                
-                if len(filtered_subreddits) >= limit:
-                    break
-            
-            return filtered_subreddits[:limit]
+                filtered_subreddits.append(subreddit["display_name"])
             
         except Exception as e:
             raise Exception(f"Failed to fetch popular subreddits: {str(e)}")
+        
+        self._set_cached(cache_key, filtered_subreddits)
+        return filtered_subreddits[:limit]
     
-    def get_trending_subreddits(self, limit: int = 20) -> List[str]:
+    async def get_trending_subreddits(self, limit: int = 20) -> List[str]:
         """
         Get trending/new popular subreddits from Reddit.
         
@@ -188,27 +581,23 @@ class RedditClient:
         """
         try:
             # Get new popular subreddits (recently gaining popularity)
-            trending_subreddits = list(self.reddit.subreddits.popular(limit=limit * 3))
+            trending_subreddits = await self._get_popular_listing(limit * 3)
             
             # Filter similar to popular subreddits
             filtered_trending = []
-            excluded_keywords = {
-                'nsfw', 'porn', 'sex', 'xxx', 'adult', 'onlyfans', 'gone', 'wild',
-                'circlejerk', 'jerk', 'shitpost', 'copypasta'
-            }
             
             for subreddit in trending_subreddits:
-                if subreddit.over18:
+                if subreddit.get("over18"):
                     continue
                     
-                subreddit_name_lower = subreddit.display_name.lower()
-                if any(keyword in subreddit_name_lower for keyword in excluded_keywords):
+                if _EXCLUDED_RE.search(subreddit["display_name"].lower()):
                     continue
                     
-                if subreddit.subscribers and subreddit.subscribers < 50000:
+                subscribers = subreddit.get("subscribers")
+                if subscribers and subscribers < 50000:
                     continue
                     
-                filtered_trending.append(subreddit.display_name)
+                filtered_trending.append(subreddit["display_name"])
                 
                 if len(filtered_trending) >= limit:
                     break
@@ -218,7 +607,23 @@ class RedditClient:
         except Exception as e:
             raise Exception(f"Failed to fetch trending subreddits: {str(e)}")
     
-    def test_connection(self) -> bool:
+    async def verify_auth(self) -> bool:
+        """
+        Verify that the client credentials are accepted by Reddit.
+        
+        This requests an OAuth token and its scopes, so it is only needed by
+        callers that want to fail fast on bad credentials.
+        
+        Returns:
+            bool: True if the credentials are valid, False otherwise
+        """
+        try:
+            await self.reddit.auth.scopes()
+            return True
+        except Exception:
+            return False
+    
+    async def test_connection(self) -> bool:
         """
         Test if the Reddit API connection is working.
         
@@ -227,9 +632,8 @@ class RedditClient:
         """
         try:
             # Try to access a well-known subreddit
-            subreddit = self.reddit.subreddit("python")
-            # Access a property to trigger an API call
-            _ = subreddit.display_name
+            # Fetching the subreddit triggers an API call
+            await self.reddit.subreddit("python", fetch=True)
             return True
         except Exception:
             return False
@@ -5,17 +5,21 @@ This module contains configurable settings for the data fetching process,
 including the list of target subreddits and fetching parameters.
 """
 
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
 # Default list of hottest subreddits for development (5 subreddits)
-DEFAULT_SUBREDDITS = [
+DEFAULT_SUBREDDITS = (
     "technology",
     "MachineLearning", 
     "programming",
     "science",
     "datascience"
-]
+)
 
 # Full list of 50 hottest subreddits (can be expanded as needed)
-FULL_SUBREDDIT_LIST = [
+FULL_SUBREDDIT_LIST = (
     # Technology & Programming
     "technology", "programming", "MachineLearning", "datascience", "artificial",
     "Python", "javascript", "webdev", "cybersecurity", "tech",
@@ -37,13 +41,18 @@ FULL_SUBREDDIT_LIST = [
     
     # Discussion & Community
     "AskReddit", "IAmA", "bestof", "OutOfTheLoop", "changemyview"
-]
+)
 
 # Data fetching configuration
 FETCHING_CONFIG = {
     # Number of hot posts to fetch per subreddit
     "posts_per_subreddit": 25,
     
+    # Whether to preload hot posts with combined multireddit listings (/r/a+b/hot),
+    # one request per group of subreddits. Multireddit listings leave out stickied
+    # posts, so preloaded subreddits are collected without them.
+    "multireddit_preload": False,
+    
     # Number of comments to fetch per post
     "comments_per_post": 50,
     
@@ -56,8 +65,13 @@ FETCHING_CONFIG = {
     # Number of subreddits to fetch when using dynamic discovery
     "dynamic_subreddit_count": 50,
     
-    # Delay between subreddit requests (in seconds) to respect rate limits
-    "request_delay": 1.0,
+    # Maximum number of subreddits fetched concurrently
+    "subreddit_concurrency": 8,
+    
+    # Maximum number of post comment trees fetched concurrently (across all subreddits).
+    # Matches the client's per-host connection limit; request pacing is left to the
+    # rate limiter, which follows Reddit's rate limit headers.
+    "comment_concurrency": 16,
     
     # Maximum retries for failed requests
     "max_retries": 3,
@@ -66,23 +80,59 @@ FETCHING_CONFIG = {
     "request_timeout": 30
 }
 
+# Response cache configuration
+CACHE_CONFIG = {
+    # Whether cached API responses may be used at all
+    "enabled": True,
+    
+    # Directory holding cached responses (shared across runs and processes)
+    "directory": os.path.join(os.path.expanduser("~"), ".cache", "redlens"),
+    
+    # Time-to-live (in seconds) for cached subreddit metadata
+    "subreddit_info_ttl": 3600,
+    
+    # Time-to-live (in seconds) for cached popular subreddit lists
+    "popular_subreddits_ttl": 86400
+}
+
 def get_target_subreddits():
     """
     Get the list of subreddits to fetch data from.
     
+    Not cached: the result follows ``use_development_list``, which scripts
+    switch at runtime, and choosing between two prebuilt tuples is already
+    constant time.
+    
     Returns:
-        List[str]: List of subreddit names based on current configuration
+        Tuple[str, ...]: Subreddit names based on current configuration
     """
     if FETCHING_CONFIG["use_development_list"]:
-        return DEFAULT_SUBREDDITS.copy()
+        return DEFAULT_SUBREDDITS
     else:
-        return FULL_SUBREDDIT_LIST.copy()
+        return FULL_SUBREDDIT_LIST
 
+@lru_cache(maxsize=1)
 def get_fetching_config():
     """
     Get the current fetching configuration.
     
+    The same read-only view is returned on every call. It reflects changes
+    made to ``FETCHING_CONFIG`` but cannot be modified through.
+    
+    Returns:
+        Mapping: Read-only configuration mapping for data fetching
+    """
+    return MappingProxyType(FETCHING_CONFIG)
+
+@lru_cache(maxsize=1)
+def get_cache_config():
+    """
+    Get the current response cache configuration.
+    
+    Like ``get_fetching_config``, the same read-only view is returned on
+    every call.
+    
     Returns:
-        dict: Configuration dictionary for data fetching
+        Mapping: Read-only configuration mapping for the response cache
     """
-    return FETCHING_CONFIG.copy()
+    return MappingProxyType(CACHE_CONFIG)
@@ -8,55 +8,59 @@ with practical examples.
 
 import sys
 import os
+import asyncio
 
-# Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the Python path so we can import our modules,
+# unless the script was run as a module (python -m scripts.<name>) from there
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.reddit_client import RedditClient
+from scripts.formatting import ellipsize
 
 
-def main():
+async def main():
     """Demonstrate Reddit client usage."""
     print("🔴 RedLens Reddit Client Demo")
     print("=" * 40)
     
     try:
         # Initialize the client
-        client = RedditClient()
-        print("✓ Reddit client initialized\n")
-        
-        # Demo: Get subreddit information
-        subreddit_name = "MachineLearning"
-        print(f"📊 Getting information for r/{subreddit_name}:")
-        subreddit_info = client.get_subreddit_info(subreddit_name)
-        print(f"   • Name: {subreddit_info['name']}")
-        print(f"   • Title: {subreddit_info['title']}")
-        print(f"   • Subscribers: {subreddit_info['subscribers']:,}")
-        print(f"   • Description: {subreddit_info['public_description'][:100]}...")
-        print()
-        
-        # Demo: Get hot posts
-        print(f"🔥 Getting top 5 hot posts from r/{subreddit_name}:")
-        hot_posts = client.get_hot_posts(subreddit_name, limit=5)
-        
-        for i, post in enumerate(hot_posts, 1):
-            print(f"   {i}. {post.title}")
-            print(f"      👍 {post.score} | 💬 {post.num_comments} comments | 👤 u/{post.author}")
-            print(f"      🔗 {post.url}")
+        async with RedditClient() as client:
+            print("✓ Reddit client initialized\n")
+            
+            # Demo: Get subreddit information
+            subreddit_name = "MachineLearning"
+            print(f"📊 Getting information for r/{subreddit_name}:")
+            subreddit_info = await client.get_subreddit_info(subreddit_name)
+            print(f"   • Name: {subreddit_info['name']}")
+            print(f"   • Title: {subreddit_info['title']}")
+            print(f"   • Subscribers: {subreddit_info['subscribers']:,}")
+            print(f"   • Description: {ellipsize(subreddit_info['public_description'], 100)}")
             print()
-        
-        # Demo: Get comments from the first post
-        if hot_posts:
-            first_post = hot_posts[0]
-            print(f"💬 Getting top 5 comments from: '{first_post.title[:50]}...'")
-            comments = client.get_top_comments(first_post, limit=5)
             
-            for i, comment in enumerate(comments, 1):
-                comment_preview = comment.body.replace('\n', ' ')[:120]
-                print(f"   {i}. {comment_preview}{'...' if len(comment.body) > 120 else ''}")
-                print(f"      👍 {comment.score} | 👤 u/{comment.author}")
+            # Demo: Get hot posts
+            print(f"🔥 Getting top 5 hot posts from r/{subreddit_name}:")
+            hot_posts = await client.get_hot_posts(subreddit_name, limit=5)
+            
+            for i, post in enumerate(hot_posts, 1):
+                print(f"   {i}. {post.title}")
+                print(f"      👍 {post.score} | 💬 {post.num_comments} comments | 👤 u/{post.author}")
+                print(f"      🔗 {post.url}")
                 print()
-        
+            
+            # Demo: Get comments from the first post
+            if hot_posts:
+                first_post = hot_posts[0]
+                print(f"💬 Getting top 5 comments from: '{ellipsize(first_post.title or 'N/A', 50)}'")
+                comments = await client.get_top_comments(first_post, limit=5)
+                
+                for i, comment in enumerate(comments, 1):
+                    comment_preview = ellipsize(comment.body or 'N/A', 120).replace('\n', ' ')
+                    print(f"   {i}. {comment_preview}")
+                    print(f"      👍 {comment.score} | 👤 u/{comment.author}")
+                    print()
+            
         print("🎉 Demo completed successfully!")
         
     except Exception as e:
@@ -64,4 +68,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,20 @@
+"""
+Console formatting helpers shared by the scripts.
+"""
+
+
+def ellipsize(text, width=50):
+    """
+    Shorten text for a one-line preview.
+    
+    Args:
+        text: Text to shorten
+        width: Maximum number of characters kept from the text
+        
+    Returns:
+        str: The text unchanged if it fits, otherwise its first ``width``
+             characters followed by '...'
+    """
+    if len(text) <= width:
+        return text
+    return f"{text[:width]}..."
@@ -8,15 +8,20 @@ saves the output to a JSON file.
 
 import sys
 import os
-import json
+import asyncio
 import argparse
+from itertools import islice
 from datetime import datetime
 
-# Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
+
+# Add the parent directory to the Python path so we can import our modules,
+# unless the script was run as a module (python -m scripts.<name>) from there
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.data_fetcher import DataFetcher
 from app.settings import get_target_subreddits, get_fetching_config
+from scripts.formatting import ellipsize
 
 
 def main():
@@ -32,9 +37,34 @@ def main():
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache and fetch fresh data"
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream each subreddit to the output file as one NDJSON line instead of "
+             "building a single JSON document in memory"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the JSON output without indentation (smaller and faster to write)"
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip-compress the output file (adds a .gz suffix if missing)"
+    )
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help and usage errors don't pay
+    # for loading Async PRAW and aiohttp
+    from app.data_fetcher import collect_data
+    
     print("🔴 RedLens Data Collection")
     print("=" * 40)
     
@@ -47,7 +77,7 @@ def main():
     print(f"  • Target subreddits: {len(subreddits)}")
     print(f"  • Posts per subreddit: {config['posts_per_subreddit']}")
     print(f"  • Comments per post: {config['comments_per_post']}")
-    print(f"  • Request delay: {config['request_delay']}s")
+    print(f"  • Concurrent subreddits: {config['subreddit_concurrency']}")
     print()
     
     if args.verbose:
@@ -55,10 +85,15 @@ def main():
         print()
     
     try:
+        # Stream records straight to disk in NDJSON mode
+        output_path = args.output or default_output_filename("ndjson" if args.ndjson else "json")
+        if args.gzip and not output_path.endswith(".gz"):
+            output_path += ".gz"
+        stream_path = output_path if args.ndjson else None
+        
         # Run data collection
         print("🚀 Starting data collection...")
-        fetcher = DataFetcher()
-        data = fetcher.fetch_all_data()
+        data = asyncio.run(collect_data(force_refresh=args.no_cache, output_path=stream_path))
         
         # Display final summary
         summary = data["summary"]
@@ -77,13 +112,10 @@ def main():
                     print(f"    - r/{error['subreddit']}: {error['error']}")
         
         # Save output if requested
-        if args.output:
-            save_data_to_file(data, args.output)
+        if stream_path:
+            print_saved_file(stream_path)
         else:
-            # Create a default filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"redlens_data_{timestamp}.json"
-            save_data_to_file(data, default_filename)
+            save_data_to_file(data, output_path, compact=args.compact)
         
         print("\n🎉 Data collection completed successfully!")
         return 0
@@ -99,24 +131,51 @@ def main():
         return 1
 
 
-def save_data_to_file(data, filename):
+def default_output_filename(extension):
+    """
+    Create a default output filename with a timestamp.
+    
+    Args:
+        extension: File extension without the leading dot
+        
+    Returns:
+        str: The output filename
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"redlens_data_{timestamp}.{extension}"
+
+
+def print_saved_file(filename):
+    """
+    Print where the output was saved along with its size.
+    
+    Args:
+        filename: Name of the output file
+    """
+    file_size = os.path.getsize(filename)
+    file_size_mb = file_size / (1024 * 1024)
+    
+    print(f"\n💾 Data saved to: {filename}")
+    print(f"   File size: {file_size_mb:.2f} MB")
+
+
+def save_data_to_file(data, filename, compact=False):
     """
     Save collected data to a JSON file.
     
     Args:
         data: The collected data dictionary
-        filename: Name of the output file
+        filename: Name of the output file, gzip-compressed if it ends in ``.gz``
+        compact: Write without indentation for machine-consumed files
     """
+    # Loaded by main() already, along with collect_data
+    from app.data_fetcher import open_output
+    
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Get file size for display
-        file_size = os.path.getsize(filename)
-        file_size_mb = file_size / (1024 * 1024)
+        with open_output(filename) as f:
+            f.write(orjson.dumps(data, option=None if compact else orjson.OPT_INDENT_2))
         
-        print(f"\n💾 Data saved to: {filename}")
-        print(f"   File size: {file_size_mb:.2f} MB")
+        print_saved_file(filename)
         
     except Exception as e:
         print(f"\n⚠️  Could not save data to file: {str(e)}")
@@ -143,16 +202,16 @@ def preview_data_structure(data, max_items=3):
     subreddits = data.get("subreddits", {})
     print(f"  Subreddits: ({len(subreddits)} total)")
     
-    for i, (subreddit_name, subreddit_data) in enumerate(list(subreddits.items())[:max_items]):
+    for i, (subreddit_name, subreddit_data) in enumerate(islice(subreddits.items(), max_items)):
         posts = subreddit_data.get("posts", [])
-        total_comments = sum(len(post.get("comments", [])) for post in posts)
         
-        print(f"    - r/{subreddit_name}: {len(posts)} posts, {total_comments} comments")
+        print(f"    - r/{subreddit_name}: {subreddit_data['post_count']} posts, "
+              f"{subreddit_data['comment_count']} comments")
         
         # Show sample post
         if posts:
             sample_post = posts[0]
-            print(f"      Sample: \"{sample_post.get('title', 'N/A')[:40]}...\"")
+            print(f"      Sample: \"{ellipsize(sample_post.title or 'N/A', 40)}\"")
     
     if len(subreddits) > max_items:
         print(f"    ... and {len(subreddits) - max_items} more subreddits")
@@ -7,14 +7,27 @@ This script tests the data fetching loop and validates the output structure.
 
 import sys
 import os
-import json
+import asyncio
+from dataclasses import replace
 from datetime import datetime
 
-# Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
 
-from app.data_fetcher import DataFetcher
+# Add the parent directory to the Python path so we can import our modules,
+# unless the script was run as a module (python -m scripts.<name>) from there
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data_fetcher import collect_data
+from app.models import Comment, Post
 from app.settings import get_target_subreddits, get_fetching_config
+from scripts.formatting import ellipsize
+
+# Keys every level of the collected data must contain
+REQUIRED_TOP_LEVEL_KEYS = frozenset({"metadata", "subreddits", "summary"})
+REQUIRED_METADATA_KEYS = frozenset({"fetch_timestamp", "total_subreddits", "config", "subreddit_list"})
+REQUIRED_SUMMARY_KEYS = frozenset({"successful_subreddits", "failed_subreddits", "total_posts", "total_comments", "errors"})
+REQUIRED_SUBREDDIT_KEYS = frozenset({"name", "fetch_timestamp", "info", "posts"})
 
 
 def test_data_fetcher():
@@ -32,14 +45,13 @@ def test_data_fetcher():
         print(f"  - Target subreddits: {len(subreddits)}")
         print(f"  - Posts per subreddit: {config['posts_per_subreddit']}")
         print(f"  - Comments per post: {config['comments_per_post']}")
-        print(f"  - Request delay: {config['request_delay']}s")
+        print(f"  - Concurrent subreddits: {config['subreddit_concurrency']}")
         print(f"  - Subreddits: {', '.join(subreddits)}")
         print()
         
         # Initialize and run data fetcher
         print("🚀 Starting data collection...")
-        fetcher = DataFetcher()
-        data = fetcher.fetch_all_data()
+        data = asyncio.run(collect_data())
         
         # Validate the output structure
         print("\n📊 Validating output structure...")
@@ -64,7 +76,7 @@ def test_data_fetcher():
         # Sample data inspection
         print("\n🔍 Sample Data Inspection:")
         if data["subreddits"]:
-            first_subreddit = list(data["subreddits"].keys())[0]
+            first_subreddit = next(iter(data["subreddits"]))
             subreddit_data = data["subreddits"][first_subreddit]
             
             print(f"  Sample subreddit: r/{first_subreddit}")
@@ -73,15 +85,15 @@ def test_data_fetcher():
             
             if subreddit_data['posts']:
                 first_post = subreddit_data['posts'][0]
-                print(f"    - Sample post: \"{first_post['title'][:50]}...\"")
-                print(f"      * Author: {first_post['author']}")
-                print(f"      * Score: {first_post['score']}")
-                print(f"      * Comments collected: {len(first_post['comments'])}")
+                print(f"    - Sample post: \"{ellipsize(first_post.title or 'N/A', 50)}\"")
+                print(f"      * Author: {first_post.author}")
+                print(f"      * Score: {first_post.score}")
+                print(f"      * Comments collected: {len(first_post.comments)}")
                 
-                if first_post['comments']:
-                    first_comment = first_post['comments'][0]
-                    comment_preview = first_comment['body'][:80].replace('\n', ' ')
-                    print(f"      * Sample comment: \"{comment_preview}...\"")
+                if first_post.comments:
+                    first_comment = first_post.comments[0]
+                    comment_preview = ellipsize(first_comment.body or 'N/A', 80).replace('\n', ' ')
+                    print(f"      * Sample comment: \"{comment_preview}\"")
         
         print("\n✅ Data fetcher test completed successfully!")
         return True
@@ -97,26 +109,21 @@ def validate_output_structure(data):
     """
     Validate that the output data has the expected structure.
     
+    Posts and comments are Post and Comment records, whose fields are fixed
+    by their classes, so each record only needs a type check.
+    
     Args:
         data: The collected data dictionary
     """
-    required_top_level_keys = ["metadata", "subreddits", "summary"]
+    # Check top-level, metadata and summary structure
+    missing = REQUIRED_TOP_LEVEL_KEYS - data.keys()
+    assert not missing, f"Missing top-level keys: {sorted(missing)}"
     
-    # Check top-level structure
-    for key in required_top_level_keys:
-        assert key in data, f"Missing top-level key: {key}"
+    missing = REQUIRED_METADATA_KEYS - data["metadata"].keys()
+    assert not missing, f"Missing metadata keys: {sorted(missing)}"
     
-    # Check metadata structure
-    metadata = data["metadata"]
-    required_metadata_keys = ["fetch_timestamp", "total_subreddits", "config", "subreddit_list"]
-    for key in required_metadata_keys:
-        assert key in metadata, f"Missing metadata key: {key}"
-    
-    # Check summary structure
-    summary = data["summary"]
-    required_summary_keys = ["successful_subreddits", "failed_subreddits", "total_posts", "total_comments", "errors"]
-    for key in required_summary_keys:
-        assert key in summary, f"Missing summary key: {key}"
+    missing = REQUIRED_SUMMARY_KEYS - data["summary"].keys()
+    assert not missing, f"Missing summary keys: {sorted(missing)}"
     
     # Check subreddits structure
     subreddits = data["subreddits"]
@@ -124,27 +131,21 @@ def validate_output_structure(data):
     
     # Validate each subreddit's data structure
     for subreddit_name, subreddit_data in subreddits.items():
-        required_subreddit_keys = ["name", "fetch_timestamp", "info", "posts"]
-        for key in required_subreddit_keys:
-            assert key in subreddit_data, f"Missing subreddit key '{key}' in r/{subreddit_name}"
+        missing = REQUIRED_SUBREDDIT_KEYS - subreddit_data.keys()
+        assert not missing, f"Missing subreddit keys {sorted(missing)} in r/{subreddit_name}"
         
         # Validate posts structure
         posts = subreddit_data["posts"]
         assert isinstance(posts, list), f"Posts should be a list for r/{subreddit_name}"
         
         for post in posts:
-            required_post_keys = ["id", "title", "author", "score", "comments"]
-            for key in required_post_keys:
-                assert key in post, f"Missing post key '{key}' in r/{subreddit_name}"
+            assert isinstance(post, Post), f"Unexpected post record in r/{subreddit_name}: {post!r}"
             
             # Validate comments structure
-            comments = post["comments"]
-            assert isinstance(comments, list), f"Comments should be a list for post {post['id']}"
-            
-            for comment in comments:
-                required_comment_keys = ["id", "author", "body", "score"]
-                for key in required_comment_keys:
-                    assert key in comment, f"Missing comment key '{key}' in post {post['id']}"
+            comments = post.comments
+            assert isinstance(comments, list), f"Comments should be a list for post {post.id}"
+            assert all(isinstance(comment, Comment) for comment in comments), \
+                f"Unexpected comment record in post {post.id}"
     
     print("✓ Output structure validation passed")
 
@@ -167,7 +168,7 @@ def save_sample_output(data, filename="sample_output.json"):
         
         # Include one subreddit with limited posts/comments
         if data["subreddits"]:
-            first_subreddit = list(data["subreddits"].keys())[0]
+            first_subreddit = next(iter(data["subreddits"]))
             subreddit_data = data["subreddits"][first_subreddit].copy()
             
             # Limit to first 2 posts
@@ -175,14 +176,15 @@ def save_sample_output(data, filename="sample_output.json"):
                 subreddit_data["posts"] = subreddit_data["posts"][:2]
             
             # Limit comments in each post to first 3
-            for post in subreddit_data["posts"]:
-                if len(post["comments"]) > 3:
-                    post["comments"] = post["comments"][:3]
+            subreddit_data["posts"] = [
+                replace(post, comments=post.comments[:3]) if len(post.comments) > 3 else post
+                for post in subreddit_data["posts"]
+            ]
             
             sample_data["sample_subreddit"] = subreddit_data
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(sample_data, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(sample_data, option=orjson.OPT_INDENT_2))
         
         print(f"📄 Sample output saved to: {filename}")
         
@@ -8,60 +8,68 @@ the actual top popular subreddits from Reddit.
 
 import sys
 import os
+import asyncio
 
-# Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the Python path so we can import our modules,
+# unless the script was run as a module (python -m scripts.<name>) from there
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.reddit_client import RedditClient
 from app.settings import get_fetching_config
+from scripts.formatting import ellipsize
 
 
-def test_dynamic_discovery():
+async def test_dynamic_discovery(client: RedditClient):
     """Test the dynamic subreddit discovery functionality."""
     print("🔍 Testing Dynamic Subreddit Discovery...")
     print("=" * 50)
     
     try:
-        # Initialize the Reddit client
-        print("1. Initializing Reddit client...")
-        client = RedditClient()
-        print("✓ Reddit client initialized")
+        print("1. Using shared Reddit client...")
         
         # Test getting popular subreddits
         print("\n2. Testing popular subreddit discovery...")
         print("   Fetching top 20 popular subreddits...")
         
-        popular_subreddits = client.get_popular_subreddits(limit=20)
+        popular_subreddits = await client.get_popular_subreddits(limit=20)
         
         print(f"✓ Successfully discovered {len(popular_subreddits)} popular subreddits")
+        
+        # Get basic info about all of them in a single request
+        try:
+            info_map = await client.get_subreddits_info_bulk(popular_subreddits)
+        except Exception:
+            info_map = {}
+        
         print("\n📊 Top Popular Subreddits (Filtered & Safe):")
         
+        # Collect the listing and print it in one write
+        lines = []
         for i, subreddit_name in enumerate(popular_subreddits, 1):
-            # Get some basic info about each subreddit
             try:
-                info = client.get_subreddit_info(subreddit_name)
+                info = info_map[subreddit_name]
                 subscribers = info.get('subscribers', 'N/A')
-                title = info.get('title', 'N/A')[:50] + ('...' if len(info.get('title', '')) > 50 else '')
+                title = ellipsize(info.get('title', 'N/A'), 50)
                 
-                print(f"   {i:2d}. r/{subreddit_name}")
-                print(f"       Title: {title}")
-                print(f"       Subscribers: {subscribers:,}" if isinstance(subscribers, int) else f"       Subscribers: {subscribers}")
-                print()
+                lines.append(f"   {i:2d}. r/{subreddit_name}")
+                lines.append(f"       Title: {title}")
+                lines.append(f"       Subscribers: {subscribers:,}" if isinstance(subscribers, int) else f"       Subscribers: {subscribers}")
             except Exception as e:
-                print(f"   {i:2d}. r/{subreddit_name} (info unavailable)")
-                print()
+                lines.append(f"   {i:2d}. r/{subreddit_name} (info unavailable)")
+            lines.append("")
+        print("\n".join(lines))
         
         # Test getting trending subreddits
         print("\n3. Testing trending subreddit discovery...")
         print("   Fetching top 10 trending subreddits...")
         
-        trending_subreddits = client.get_trending_subreddits(limit=10)
+        trending_subreddits = await client.get_trending_subreddits(limit=10)
         
         print(f"✓ Successfully discovered {len(trending_subreddits)} trending subreddits")
         print("\n🔥 Trending Subreddits:")
         
-        for i, subreddit_name in enumerate(trending_subreddits, 1):
-            print(f"   {i:2d}. r/{subreddit_name}")
+        print("\n".join(f"   {i:2d}. r/{subreddit_name}" for i, subreddit_name in enumerate(trending_subreddits, 1)))
         
         # Test production configuration
         print("\n4. Testing production configuration...")
@@ -73,7 +81,7 @@ def test_dynamic_discovery():
         
         if not config['use_development_list'] and config['use_dynamic_discovery']:
             print("\n   🚀 Production mode with dynamic discovery would fetch:")
-            production_subreddits = client.get_popular_subreddits(limit=config['dynamic_subreddit_count'])
+            production_subreddits = await client.get_popular_subreddits(limit=config['dynamic_subreddit_count'])
             print(f"   → {len(production_subreddits)} dynamically discovered subreddits")
             print(f"   → First 10: {', '.join(production_subreddits[:10])}")
         else:
@@ -89,17 +97,15 @@ def test_dynamic_discovery():
         return False
 
 
-def test_filtering():
+async def test_filtering(client: RedditClient):
     """Test the filtering mechanisms for subreddits."""
     print("\n\n🛡️  Testing Subreddit Filtering...")
     print("=" * 40)
     
     try:
-        client = RedditClient()
-        
         # Get a larger sample to see filtering in action
         print("Fetching 100 popular subreddits to test filtering...")
-        raw_subreddits = list(client.reddit.subreddits.popular(limit=100))
+        raw_subreddits = [sub async for sub in client.reddit.subreddits.popular(limit=100)]
         
         print(f"Raw subreddits fetched: {len(raw_subreddits)}")
         
@@ -108,7 +114,7 @@ def test_filtering():
         small_count = sum(1 for sub in raw_subreddits if sub.subscribers and sub.subscribers < 10000)
         
         # Apply our filtering
-        filtered = client.get_popular_subreddits(limit=50)
+        filtered = await client.get_popular_subreddits(limit=50)
         
         print(f"NSFW subreddits filtered out: {nsfw_count}")
         print(f"Small subreddits filtered out: {small_count}")
@@ -122,9 +128,14 @@ def test_filtering():
         return False
 
 
+async def main():
+    """Run both checks with one shared Reddit client."""
+    async with RedditClient() as client:
+        return await test_dynamic_discovery(client), await test_filtering(client)
+
+
 if __name__ == "__main__":
-    success1 = test_dynamic_discovery()
-    success2 = test_filtering()
+    success1, success2 = asyncio.run(main())
     
     if success1 and success2:
         print("\n🎉 All dynamic discovery tests passed!")
@@ -4,26 +4,62 @@ Test script for production mode with dynamic discovery.
 
 This script temporarily switches to production mode to test
 dynamic subreddit discovery functionality.
+
+Pass --yes (or set REDLENS_AUTO_RUN=1) to also run the quick data
+collection test without being prompted.
 """
 
 import sys
 import os
+import asyncio
+import argparse
 
-# Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the Python path so we can import our modules,
+# unless the script was run as a module (python -m scripts.<name>) from there
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.data_fetcher import DataFetcher
+from app.reddit_client import RedditClient
 from app.settings import FETCHING_CONFIG
 
 
-def test_production_mode():
-    """Test production mode with dynamic discovery."""
+def should_run_collection(auto_run):
+    """
+    Decide whether to run the quick data collection test.
+    
+    Args:
+        auto_run: Run without prompting (from --yes or REDLENS_AUTO_RUN)
+        
+    Returns:
+        bool: True if the collection test should run
+    """
+    if auto_run:
+        return True
+    
+    # Never block on a prompt when nobody can answer it (e.g. in CI)
+    if not sys.stdin.isatty():
+        print("   Skipping (non-interactive; pass --yes to run it).")
+        return False
+    
+    response = input("   Continue? (y/N): ").strip().lower()
+    return response == 'y' or response == 'yes'
+
+
+async def test_production_mode(auto_run=False):
+    """
+    Test production mode with dynamic discovery.
+    
+    Args:
+        auto_run: Run the quick data collection test without prompting
+    """
     print("🏭 Testing Production Mode with Dynamic Discovery...")
     print("=" * 60)
     
     # Temporarily switch to production mode
     original_dev_mode = FETCHING_CONFIG["use_development_list"]
     original_dynamic = FETCHING_CONFIG["use_dynamic_discovery"]
+    client = None
     
     try:
         # Enable production mode with dynamic discovery
@@ -37,19 +73,23 @@ def test_production_mode():
         print(f"  • Target subreddit count: {FETCHING_CONFIG['dynamic_subreddit_count']}")
         print()
         
-        # Initialize DataFetcher (this will trigger dynamic discovery)
+        # One client (and its connection pool) is shared by every fetcher below
+        client = RedditClient()
+        
+        # Resolve target subreddits (this will trigger dynamic discovery)
         print("🔍 Initializing DataFetcher with dynamic discovery...")
-        fetcher = DataFetcher()
+        fetcher = DataFetcher(reddit_client=client)
+        await fetcher.load_target_subreddits()
         
         print(f"✓ Successfully discovered {len(fetcher.target_subreddits)} subreddits")
         print("\n📊 Dynamically Discovered Subreddits:")
         
-        for i, subreddit in enumerate(fetcher.target_subreddits, 1):
-            print(f"   {i:2d}. r/{subreddit}")
+        print("\n".join(f"   {i:2d}. r/{subreddit}" for i, subreddit in enumerate(fetcher.target_subreddits, 1)))
         
         # Compare with static list
         FETCHING_CONFIG["use_dynamic_discovery"] = False
-        static_fetcher = DataFetcher()
+        static_fetcher = DataFetcher(reddit_client=client)
+        await static_fetcher.load_target_subreddits()
         
         print(f"\n📋 Comparison with Static List ({len(static_fetcher.target_subreddits)} subreddits):")
         
@@ -67,22 +107,18 @@ def test_production_mode():
         
         if only_in_dynamic:
             print(f"\n   🆕 New subreddits from dynamic discovery:")
-            for subreddit in sorted(only_in_dynamic):
-                print(f"      • r/{subreddit}")
+            print("\n".join(f"      • r/{subreddit}" for subreddit in sorted(only_in_dynamic)))
         
         if only_in_static:
             print(f"\n   📝 Subreddits only in static list:")
-            for subreddit in sorted(only_in_static):
-                print(f"      • r/{subreddit}")
+            print("\n".join(f"      • r/{subreddit}" for subreddit in sorted(only_in_static)))
         
         print("\n✅ Production mode test completed successfully!")
         
         # Ask if user wants to run a quick data collection test
         print("\n🚀 Would you like to run a quick data collection test?")
         print("   This will fetch 1 post from each dynamically discovered subreddit.")
-        response = input("   Continue? (y/N): ").strip().lower()
-        
-        if response == 'y' or response == 'yes':
+        if should_run_collection(auto_run):
             # Temporarily reduce collection size for testing
             original_posts = FETCHING_CONFIG["posts_per_subreddit"]
             original_comments = FETCHING_CONFIG["comments_per_post"]
@@ -94,8 +130,8 @@ def test_production_mode():
             
             # Re-enable dynamic discovery
             FETCHING_CONFIG["use_dynamic_discovery"] = True
-            test_fetcher = DataFetcher()
-            data = test_fetcher.fetch_all_data()
+            test_fetcher = DataFetcher(reddit_client=client)
+            data = await test_fetcher.fetch_all_data()
             
             # Display results
             summary = data["summary"]
@@ -118,6 +154,9 @@ def test_production_mode():
         return False
         
     finally:
+        if client is not None:
+            await client.close()
+        
         # Restore original configuration
         FETCHING_CONFIG["use_development_list"] = original_dev_mode
         FETCHING_CONFIG["use_dynamic_discovery"] = original_dynamic
@@ -125,5 +164,14 @@ def test_production_mode():
 
 
 if __name__ == "__main__":
-    success = test_production_mode()
+    parser = argparse.ArgumentParser(description="Test production mode with dynamic discovery")
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Run the quick data collection test without prompting"
+    )
+    args = parser.parse_args()
+    
+    auto_run = args.yes or os.environ.get("REDLENS_AUTO_RUN", "").lower() in ("1", "true", "yes")
+    success = asyncio.run(test_production_mode(auto_run=auto_run))
     sys.exit(0 if success else 1)
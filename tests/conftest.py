@@ -0,0 +1,49 @@
+"""
+Pytest configuration for the unit tests.
+"""
+
+import socket
+
+import pytest
+
+# Hosts tests may still connect to while the network is blocked
+ALLOWED_HOSTS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+def pytest_collection_modifyitems(config, items):
+    """Add the ``live`` marker to tests and test classes decorated with ``@live``."""
+    for item in items:
+        if (getattr(getattr(item, "function", None), "live", False)
+                or getattr(getattr(item, "cls", None), "live", False)):
+            item.add_marker(pytest.mark.live)
+
+
+@pytest.fixture(autouse=True)
+def block_network(request, monkeypatch):
+    """
+    Fail any test not marked ``live`` that tries to reach the network.
+    
+    A forgotten mock then fails straight away instead of stalling on a real
+    request. Local connections and Unix sockets are still allowed.
+    """
+    if request.node.get_closest_marker("live"):
+        return
+    
+    def blocked(host):
+        raise RuntimeError(f"Network access to {host!r} is blocked in tests not marked live")
+    
+    real_connect = socket.socket.connect
+    real_getaddrinfo = socket.getaddrinfo
+    
+    def guarded_connect(sock, address):
+        if sock.family != socket.AF_UNIX and address[0] not in ALLOWED_HOSTS:
+            blocked(address[0])
+        return real_connect(sock, address)
+    
+    def guarded_getaddrinfo(host, *args, **kwargs):
+        if host is not None and host not in ALLOWED_HOSTS:
+            blocked(host)
+        return real_getaddrinfo(host, *args, **kwargs)
+    
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    monkeypatch.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
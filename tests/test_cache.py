@@ -0,0 +1,89 @@
+"""
+Unit tests for the TTLCache class.
+
+These tests verify the on-disk response cache used by the Reddit client.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the Python path so we can import our modules
+# when this file is run directly (pytest gets it from pytest.ini)
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for the TTLCache class."""
+    
+    def setUp(self):
+        """Set up a cache in a fresh temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = TTLCache(os.path.join(self.tmp_dir.name, "cache"))
+    
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.tmp_dir.cleanup()
+    
+    def test_miss_returns_none(self):
+        """Test that an unknown key is a cache miss."""
+        self.assertIsNone(self.cache.get("missing", ttl=60))
+    
+    def test_set_and_get(self):
+        """Test that stored values are returned while fresh."""
+        value = {"name": "python", "subscribers": 1200000}
+        self.cache.set("subreddit_info:python", value)
+        
+        self.assertEqual(self.cache.get("subreddit_info:python", ttl=60), value)
+    
+    def test_empty_list_is_a_hit(self):
+        """Test that falsy values are still treated as cache hits."""
+        self.cache.set("popular_subreddits:10", [])
+        
+        self.assertEqual(self.cache.get("popular_subreddits:10", ttl=60), [])
+    
+    def test_expired_entry_returns_none(self):
+        """Test that entries older than the TTL are ignored."""
+        self.cache.set("subreddit_info:python", {"name": "python"})
+        
+        # Backdate the entry so it is older than the TTL
+        path = self.cache._path("subreddit_info:python")
+        old_time = os.path.getmtime(path) - 120
+        os.utime(path, (old_time, old_time))
+        
+        # Read through a fresh instance so the in-memory copy is not used
+        self.cache = TTLCache(self.cache.directory)
+        self.assertIsNone(self.cache.get("subreddit_info:python", ttl=60))
+        self.assertEqual(self.cache.get("subreddit_info:python", ttl=300), {"name": "python"})
+    
+    def test_repeated_get_is_served_from_memory(self):
+        """Test that entries stay available in memory once read or written."""
+        self.cache.set("subreddit_info:python", {"name": "python"})
+        os.remove(self.cache._path("subreddit_info:python"))
+        
+        # The instance that wrote the entry no longer needs the file
+        self.assertEqual(self.cache.get("subreddit_info:python", ttl=60), {"name": "python"})
+        
+        # A new instance (e.g. another process) only sees what is on disk
+        other = TTLCache(self.cache.directory)
+        self.assertIsNone(other.get("subreddit_info:python", ttl=60))
+    
+    def test_unwritable_directory_keeps_entry_in_memory(self):
+        """Test that a failed disk write is logged and the entry stays usable."""
+        # A directory below a regular file cannot be created, even by root
+        blocker = os.path.join(self.tmp_dir.name, "not_a_directory")
+        open(blocker, "w").close()
+        cache = TTLCache(os.path.join(blocker, "cache"))
+        
+        with self.assertLogs("app.cache", level="WARNING"):
+            cache.set("popular_subreddits", ["python"])
+        
+        self.assertEqual(cache.get("popular_subreddits", ttl=60), ["python"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -4,112 +4,182 @@ Unit tests for the DataFetcher class.
 These tests verify the functionality of the data fetching service.
 """
 
+import asyncio
+import copy
+import gzip
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from collections.abc import Mapping
+from unittest.mock import AsyncMock, patch
 import sys
 import os
-from datetime import datetime
+import json
+import tempfile
+from dataclasses import fields
+from types import MappingProxyType, SimpleNamespace
 
 # Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# when this file is run directly (pytest gets it from pytest.ini)
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data_fetcher import DataFetcher, _new_summary
+from app.models import Comment, Post
+from app.reddit_client import RedditClient
+from app.settings import get_cache_config, get_target_subreddits, get_fetching_config
+
+
+# Attribute values for stand-in Async PRAW posts and comments
+POST_DEFAULTS = {
+    "id": "test_post_id",
+    "title": "Test Post Title",
+    "author": "test_user",
+    "score": 100,
+    "upvote_ratio": 0.95,
+    "num_comments": 50,
+    "created_utc": 1640995200,  # 2022-01-01 timestamp
+    "url": "https://reddit.com/r/test",
+    "permalink": "/r/test/comments/test_post_id/",
+    "selftext": "This is test content",
+    "is_self": True,
+    "domain": "self.test",
+    "subreddit": "test",
+    "gilded": 0,
+    "stickied": False,
+    "over_18": False,
+    "spoiler": False,
+    "locked": False
+}
+
+COMMENT_DEFAULTS = {
+    "id": "test_comment_id",
+    "author": "comment_user",
+    "body": "This is a test comment",
+    "score": 25,
+    "created_utc": 1640995260,  # 2022-01-01 timestamp + 1 minute
+    "gilded": 0,
+    "is_submitter": False,
+    "stickied": False,
+    "permalink": "/r/test/comments/test_post_id/comment/test_comment_id/",
+    "parent_id": "t3_test_post_id",
+    "depth": 0
+}
+
+
+# Fetch timestamp carried by stand-in subreddit records
+FIXED_FETCH_TS = "2022-01-01T00:00:00+00:00"
+
+
+# A successfully fetched subreddit record with one post carrying one comment,
+# shared read-only by the tests; copy it to get a mutable record
+SUCCESS_DATA = MappingProxyType({
+    "name": "success",
+    "fetch_timestamp": FIXED_FETCH_TS,
+    "info": {"name": "success", "subscribers": 1000},
+    "posts": [Post(
+        id="test_post",
+        title="Test Post",
+        comments=[Comment(id="test_comment", body="Test comment")]
+    )],
+    "post_count": 1,
+    "comment_count": 1
+})
+
+
+# Fields extracted records copy from the Async PRAW object, taken from the
+# record dataclasses; a post's comments are fetched separately
+EXPECTED_POST_FIELDS = frozenset(f.name for f in fields(Post)) - {"comments"}
+EXPECTED_COMMENT_FIELDS = frozenset(f.name for f in fields(Comment))
+
+
+# Prebuilt stand-ins that the factories below copy instead of rebuilding
+BASE_MOCK_POST = SimpleNamespace(**POST_DEFAULTS)
+BASE_MOCK_COMMENT = SimpleNamespace(**COMMENT_DEFAULTS)
+
+
+def make_mock_post(**overrides):
+    """Create a stand-in Async PRAW post (a plain attribute bag) with default attributes."""
+    post = copy.copy(BASE_MOCK_POST)
+    vars(post).update(overrides)
+    return post
+
+
+def make_mock_comment(**overrides):
+    """Create a stand-in Async PRAW comment (a plain attribute bag) with default attributes."""
+    comment = copy.copy(BASE_MOCK_COMMENT)
+    vars(comment).update(overrides)
+    return comment
+
 
-from app.data_fetcher import DataFetcher
-from app.settings import get_target_subreddits, get_fetching_config
+async def fetch_always_succeeds(subreddit_name, **kwargs):
+    """Stand-in for DataFetcher._fetch_subreddit_data that always succeeds."""
+    return {**SUCCESS_DATA, "name": subreddit_name}
 
 
-class TestDataFetcher(unittest.TestCase):
+async def fetch_fails_for_failure(subreddit_name, **kwargs):
+    """Stand-in for DataFetcher._fetch_subreddit_data that fails for r/failure."""
+    if subreddit_name == "failure":
+        raise Exception("Simulated failure")
+    return {**SUCCESS_DATA, "name": subreddit_name}
+
+
+class TestDataFetcher(unittest.IsolatedAsyncioTestCase):
     """Test cases for the DataFetcher class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the mock Reddit client shared by all test methods."""
+        # Mock the RedditClient to avoid actual API calls during testing; the spec
+        # rejects methods the real client does not have
+        cls.mock_reddit_client = AsyncMock(spec=RedditClient)
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # Mock the RedditClient to avoid actual API calls during testing
-        self.mock_reddit_client = Mock()
+        # Clear calls and canned responses left by the previous test
+        self.mock_reddit_client.reset_mock(return_value=True, side_effect=True)
+        self.mock_reddit_client.get_subreddits_info_bulk.return_value = {}
+        self.mock_reddit_client.get_hot_posts_multi.return_value = {}
         self.fetcher = DataFetcher(reddit_client=self.mock_reddit_client)
     
-    def test_initialization(self):
+    async def test_initialization(self):
         """Test that DataFetcher initializes correctly."""
         self.assertIsNotNone(self.fetcher.reddit_client)
         self.assertIsNotNone(self.fetcher.config)
+        await self.fetcher.load_target_subreddits()
         self.assertIsNotNone(self.fetcher.target_subreddits)
         self.assertGreater(len(self.fetcher.target_subreddits), 0)
     
     def test_extract_post_data(self):
         """Test post data extraction."""
         # Create a mock post object
-        mock_post = Mock()
-        mock_post.id = "test_post_id"
-        mock_post.title = "Test Post Title"
-        mock_post.author = "test_user"
-        mock_post.score = 100
-        mock_post.upvote_ratio = 0.95
-        mock_post.num_comments = 50
-        mock_post.created_utc = 1640995200  # 2022-01-01 timestamp
-        mock_post.url = "https://reddit.com/r/test"
-        mock_post.permalink = "/r/test/comments/test_post_id/"
-        mock_post.selftext = "This is test content"
-        mock_post.is_self = True
-        mock_post.domain = "self.test"
-        mock_post.subreddit = "test"
-        mock_post.gilded = 0
-        mock_post.stickied = False
-        mock_post.over_18 = False
-        mock_post.spoiler = False
-        mock_post.locked = False
+        mock_post = make_mock_post()
         
         # Test extraction
         post_data = self.fetcher._extract_post_data(mock_post)
         
-        # Verify all expected fields are present
-        expected_fields = [
-            "id", "title", "author", "score", "upvote_ratio", "num_comments",
-            "created_utc", "url", "permalink", "selftext", "is_self", "domain",
-            "subreddit", "gilded", "stickied", "over_18", "spoiler", "locked"
-        ]
-        
-        for field in expected_fields:
-            self.assertIn(field, post_data)
-        
-        # Verify specific values
-        self.assertEqual(post_data["id"], "test_post_id")
-        self.assertEqual(post_data["title"], "Test Post Title")
-        self.assertEqual(post_data["author"], "test_user")
-        self.assertEqual(post_data["score"], 100)
+        # Verify every field is copied from the post, with the permalink made absolute
+        self.assertEqual(POST_DEFAULTS.keys(), EXPECTED_POST_FIELDS)
+        self.assertEqual(
+            {name: getattr(post_data, name) for name in EXPECTED_POST_FIELDS},
+            {**POST_DEFAULTS, "permalink": "https://reddit.com" + POST_DEFAULTS["permalink"]}
+        )
+        self.assertEqual(post_data.comments, [])
     
     def test_extract_comment_data(self):
         """Test comment data extraction."""
         # Create a mock comment object
-        mock_comment = Mock()
-        mock_comment.id = "test_comment_id"
-        mock_comment.author = "comment_user"
-        mock_comment.body = "This is a test comment"
-        mock_comment.score = 25
-        mock_comment.created_utc = 1640995260  # 2022-01-01 timestamp + 1 minute
-        mock_comment.gilded = 0
-        mock_comment.is_submitter = False
-        mock_comment.stickied = False
-        mock_comment.permalink = "/r/test/comments/test_post_id/comment/test_comment_id/"
-        mock_comment.parent_id = "t3_test_post_id"
-        mock_comment.depth = 0
+        mock_comment = make_mock_comment()
         
         # Test extraction
         comment_data = self.fetcher._extract_comment_data(mock_comment)
         
-        # Verify all expected fields are present
-        expected_fields = [
-            "id", "author", "body", "score", "created_utc", "gilded",
-            "is_submitter", "stickied", "permalink", "parent_id", "depth"
-        ]
-        
-        for field in expected_fields:
-            self.assertIn(field, comment_data)
-        
-        # Verify specific values
-        self.assertEqual(comment_data["id"], "test_comment_id")
-        self.assertEqual(comment_data["body"], "This is a test comment")
-        self.assertEqual(comment_data["score"], 25)
+        # Verify every field is copied from the comment, with the permalink made absolute
+        self.assertEqual(COMMENT_DEFAULTS.keys(), EXPECTED_COMMENT_FIELDS)
+        self.assertEqual(
+            {name: getattr(comment_data, name) for name in EXPECTED_COMMENT_FIELDS},
+            {**COMMENT_DEFAULTS, "permalink": "https://reddit.com" + COMMENT_DEFAULTS["permalink"]}
+        )
     
-    @patch('app.data_fetcher.time.sleep')  # Mock sleep to speed up tests
-    def test_fetch_subreddit_data(self, mock_sleep):
+    async def test_fetch_subreddit_data(self):
         """Test fetching data from a single subreddit."""
         # Mock subreddit info
         mock_subreddit_info = {
@@ -120,46 +190,38 @@ class TestDataFetcher(unittest.TestCase):
         self.mock_reddit_client.get_subreddit_info.return_value = mock_subreddit_info
         
         # Mock posts
-        mock_post = Mock()
-        mock_post.id = "test_post"
-        mock_post.title = "Test Post"
-        mock_post.author = "test_user"
-        mock_post.score = 100
-        mock_post.upvote_ratio = 0.95
-        mock_post.num_comments = 10
-        mock_post.created_utc = 1640995200
-        mock_post.url = "https://test.com"
-        mock_post.permalink = "/r/test/comments/test_post/"
-        mock_post.selftext = ""
-        mock_post.is_self = False
-        mock_post.domain = "test.com"
-        mock_post.subreddit = "test"
-        mock_post.gilded = 0
-        mock_post.stickied = False
-        mock_post.over_18 = False
-        mock_post.spoiler = False
-        mock_post.locked = False
-        
-        self.mock_reddit_client.get_hot_posts.return_value = [mock_post]
-        
-        # Mock comments
-        mock_comment = Mock()
-        mock_comment.id = "test_comment"
-        mock_comment.author = "comment_user"
-        mock_comment.body = "Test comment"
-        mock_comment.score = 10
-        mock_comment.created_utc = 1640995260
-        mock_comment.gilded = 0
-        mock_comment.is_submitter = False
-        mock_comment.stickied = False
-        mock_comment.permalink = "/r/test/comments/test_post/comment/test_comment/"
-        mock_comment.parent_id = "t3_test_post"
-        mock_comment.depth = 0
-        
-        self.mock_reddit_client.get_top_comments.return_value = [mock_comment]
+        mock_post = make_mock_post(
+            id="test_post",
+            title="Test Post",
+            num_comments=10,
+            url="https://test.com",
+            permalink="/r/test/comments/test_post/",
+            selftext="",
+            is_self=False,
+            domain="test.com"
+        )
+        
+        self.mock_reddit_client.get_hot_posts_fast.return_value = [mock_post]
+        
+        # Mock comments (raw JSON comment data)
+        mock_comment = {
+            "id": "test_comment",
+            "author": "comment_user",
+            "body": "Test comment",
+            "score": 10,
+            "created_utc": 1640995260,
+            "gilded": 0,
+            "is_submitter": False,
+            "stickied": False,
+            "permalink": "/r/test/comments/test_post/comment/test_comment/",
+            "parent_id": "t3_test_post",
+            "depth": 0
+        }
+        
+        self.mock_reddit_client.get_top_comments_fast.return_value = [mock_comment]
         
         # Test fetching
-        subreddit_data = self.fetcher._fetch_subreddit_data("test")
+        subreddit_data = await self.fetcher._fetch_subreddit_data("test")
         
         # Verify structure
         self.assertIn("name", subreddit_data)
@@ -169,101 +231,233 @@ class TestDataFetcher(unittest.TestCase):
         
         # Verify data
         self.assertEqual(subreddit_data["name"], "test")
+        self.assertIsNotNone(subreddit_data["fetch_timestamp"])
         self.assertEqual(subreddit_data["info"], mock_subreddit_info)
         self.assertEqual(len(subreddit_data["posts"]), 1)
+        self.assertEqual(subreddit_data["post_count"], 1)
+        self.assertEqual(subreddit_data["comment_count"], 1)
         
         # Verify post data
         post_data = subreddit_data["posts"][0]
-        self.assertEqual(post_data["id"], "test_post")
-        self.assertEqual(len(post_data["comments"]), 1)
+        self.assertEqual(post_data.id, "test_post")
+        self.assertEqual(len(post_data.comments), 1)
         
         # Verify comment data
-        comment_data = post_data["comments"][0]
-        self.assertEqual(comment_data["id"], "test_comment")
+        comment_data = post_data.comments[0]
+        self.assertEqual(comment_data.id, "test_comment")
     
-    @patch('app.data_fetcher.time.sleep')
-    def test_fetch_all_data_success(self, mock_sleep):
-        """Test successful data fetching from all subreddits."""
-        # Mock the _fetch_subreddit_data method to return test data
-        test_subreddit_data = {
-            "name": "test",
-            "fetch_timestamp": datetime.now().isoformat(),
-            "info": {"name": "test", "subscribers": 1000},
-            "posts": [{
-                "id": "test_post",
-                "title": "Test Post",
-                "comments": [{"id": "test_comment", "body": "Test comment"}]
-            }]
-        }
+    async def test_fetch_subreddit_data_comment_failure(self):
+        """Test that a failed comment fetch only empties that post's comments."""
+        self.mock_reddit_client.get_subreddit_info.return_value = {"name": "test"}
+        
+        failing_post = {"id": "failing_post", "subreddit": "test"}
+        working_post = {"id": "working_post", "subreddit": "test"}
+        self.mock_reddit_client.get_hot_posts_fast.return_value = [failing_post, working_post]
+        
+        mock_comment = {"id": "test_comment"}
+        
+        async def mock_get_top_comments_fast(post_id, subreddit_name, limit):
+            if post_id == "failing_post":
+                raise Exception("Simulated comment failure")
+            return [mock_comment]
         
-        # Override target subreddits for testing
+        self.mock_reddit_client.get_top_comments_fast.side_effect = mock_get_top_comments_fast
+        
+        subreddit_data = await self.fetcher._fetch_subreddit_data("test")
+        
+        # Posts keep their listing order and only the failing one loses comments
+        posts = subreddit_data["posts"]
+        self.assertEqual([post.id for post in posts], ["failing_post", "working_post"])
+        self.assertEqual(posts[0].comments, [])
+        self.assertEqual(len(posts[1].comments), 1)
+        self.assertEqual(posts[1].comments[0].id, "test_comment")
+    
+    async def test_fetch_comments_falls_back_to_praw(self):
+        """Test that comment limits above one page use the Async PRAW comment tree."""
+        self.fetcher.config = {**self.fetcher.config, "comments_per_post": 150}
+        mock_post = make_mock_post(id="test_post")
+        self.mock_reddit_client.get_top_comments.return_value = [make_mock_comment(id="test_comment")]
+        
+        comments = await self.fetcher._fetch_and_extract_comments(mock_post)
+        
+        self.mock_reddit_client.get_top_comments.assert_awaited_once_with(mock_post, limit=150)
+        
+        # Posts from the JSON listing are passed by ID
+        await self.fetcher._fetch_and_extract_comments({"id": "json_post", "subreddit": "test"})
+        self.mock_reddit_client.get_top_comments.assert_awaited_with("json_post", limit=150)
+        self.mock_reddit_client.get_top_comments_fast.assert_not_awaited()
+        self.assertEqual(comments[0].id, "test_comment")
+    
+    async def test_fetch_all_data(self):
+        """Test fetching all subreddits, with and without subreddit failures."""
+        # (fetch stand-in, expected successful subreddits, expected failed subreddits)
+        cases = [
+            (fetch_always_succeeds, ["test1", "test2"], []),
+            (fetch_fails_for_failure, ["success"], ["failure"]),
+        ]
+        
+        for side_effect, successes, failures in cases:
+            with self.subTest(side_effect=side_effect.__name__):
+                # Override target subreddits for testing
+                self.fetcher.target_subreddits = successes + failures
+                
+                # The fetcher is rebuilt for every test, so its method can be replaced outright
+                mock_fetch = self.fetcher._fetch_subreddit_data = AsyncMock(side_effect=side_effect)
+                result = await self.fetcher.fetch_all_data()
+                
+                # Verify structure
+                self.assertIn("metadata", result)
+                self.assertIn("subreddits", result)
+                self.assertIn("summary", result)
+                
+                # Verify metadata
+                metadata = result["metadata"]
+                self.assertIn("fetch_timestamp", metadata)
+                self.assertEqual(metadata["total_subreddits"], 2)
+                
+                # Every subreddit is fetched with the batch timestamp
+                for call in mock_fetch.await_args_list:
+                    self.assertEqual(call.kwargs["fetch_timestamp"], metadata["fetch_timestamp"])
+                
+                # Verify summary; each stand-in record has 1 post with 1 comment
+                summary = result["summary"]
+                self.assertEqual(summary["successful_subreddits"], len(successes))
+                self.assertEqual(summary["failed_subreddits"], len(failures))
+                self.assertEqual(summary["total_posts"], len(successes))
+                self.assertEqual(summary["total_comments"], len(successes))
+                
+                # Verify error details
+                self.assertEqual([error["subreddit"] for error in summary["errors"]], failures)
+                for error in summary["errors"]:
+                    self.assertIn("Simulated failure", error["error"])
+                
+                # Verify only successful subreddit data is included
+                self.assertEqual(sorted(result["subreddits"]), successes)
+                for name, record in result["subreddits"].items():
+                    self.assertEqual(record["name"], name)
+    
+    async def test_fetch_all_data_uses_preloaded_info(self):
+        """Test that bulk-loaded subreddit info replaces per-subreddit info requests."""
+        preloaded_info = {"name": "test1", "subscribers": 1000}
+        self.mock_reddit_client.get_subreddits_info_bulk.return_value = {"test1": preloaded_info}
+        self.mock_reddit_client.get_subreddit_info.return_value = {"name": "test2"}
+        self.mock_reddit_client.get_hot_posts_fast.return_value = []
         self.fetcher.target_subreddits = ["test1", "test2"]
         
-        with patch.object(self.fetcher, '_fetch_subreddit_data', return_value=test_subreddit_data):
-            result = self.fetcher.fetch_all_data()
+        result = await self.fetcher.fetch_all_data()
         
-        # Verify structure
-        self.assertIn("metadata", result)
-        self.assertIn("subreddits", result)
-        self.assertIn("summary", result)
-        
-        # Verify metadata
-        metadata = result["metadata"]
-        self.assertIn("fetch_timestamp", metadata)
-        self.assertIn("total_subreddits", metadata)
-        self.assertEqual(metadata["total_subreddits"], 2)
-        
-        # Verify summary
-        summary = result["summary"]
-        self.assertEqual(summary["successful_subreddits"], 2)
-        self.assertEqual(summary["failed_subreddits"], 0)
-        self.assertEqual(summary["total_posts"], 2)  # 1 post per subreddit
-        self.assertEqual(summary["total_comments"], 2)  # 1 comment per post
-        self.assertEqual(len(summary["errors"]), 0)
-        
-        # Verify subreddits data
-        self.assertEqual(len(result["subreddits"]), 2)
-        self.assertIn("test1", result["subreddits"])
-        self.assertIn("test2", result["subreddits"])
+        # Only the subreddit missing from the bulk response is looked up individually
+        self.mock_reddit_client.get_subreddits_info_bulk.assert_awaited_once()
+        self.mock_reddit_client.get_subreddit_info.assert_awaited_once_with("test2", force_refresh=False)
+        self.assertEqual(result["subreddits"]["test1"]["info"], preloaded_info)
+        self.assertEqual(result["subreddits"]["test2"]["info"], {"name": "test2"})
     
-    @patch('app.data_fetcher.time.sleep')
-    def test_fetch_all_data_with_errors(self, mock_sleep):
-        """Test data fetching with some subreddit failures."""
-        # Mock successful data for one subreddit
-        success_data = {
-            "name": "success",
-            "fetch_timestamp": datetime.now().isoformat(),
-            "info": {"name": "success", "subscribers": 1000},
-            "posts": [{"id": "post1", "title": "Post 1", "comments": []}]
+    async def test_fetch_all_data_uses_multireddit_hot_posts(self):
+        """Test that hot posts are preloaded with multireddit requests where they fill the limit."""
+        post_limit = self.fetcher.config["posts_per_subreddit"]
+        full_posts = [{"id": f"p{i}", "subreddit": "test1"} for i in range(post_limit)]
+        self.mock_reddit_client.get_hot_posts_multi.return_value = {
+            "test1": full_posts,
+            "test2": [{"id": "q0", "subreddit": "test2"}]
         }
+        self.mock_reddit_client.get_hot_posts_fast.return_value = []
+        self.mock_reddit_client.get_top_comments_fast.return_value = []
+        self.fetcher.target_subreddits = ["test1", "test2"]
         
-        # Override target subreddits for testing
-        self.fetcher.target_subreddits = ["success", "failure"]
+        with patch.dict('app.settings.FETCHING_CONFIG', {"multireddit_preload": True}):
+            result = await self.fetcher.fetch_all_data()
         
-        def mock_fetch_subreddit_data(subreddit_name):
-            if subreddit_name == "success":
-                return success_data
-            else:
-                raise Exception("Simulated failure")
+        # Both subreddits share one listing request
+        self.mock_reddit_client.get_hot_posts_multi.assert_awaited_once_with(
+            ["test1", "test2"], limit_per_subreddit=post_limit
+        )
+        self.assertEqual(len(result["subreddits"]["test1"]["posts"]), post_limit)
         
-        with patch.object(self.fetcher, '_fetch_subreddit_data', side_effect=mock_fetch_subreddit_data):
-            result = self.fetcher.fetch_all_data()
+        # A subreddit crowded out of the combined listing is fetched on its own
+        self.mock_reddit_client.get_hot_posts_fast.assert_awaited_once_with("test2", limit=post_limit)
+    
+    async def test_preload_hot_posts_skipped(self):
+        """Test that hot posts are not preloaded when disabled or when no listing page fits them."""
+        self.fetcher.target_subreddits = ["test1", "test2"]
+        cases = [
+            {"multireddit_preload": False},
+            {"multireddit_preload": True, "posts_per_subreddit": 0},
+            {"multireddit_preload": True, "posts_per_subreddit": 101},
+        ]
         
-        # Verify summary shows both success and failure
-        summary = result["summary"]
-        self.assertEqual(summary["successful_subreddits"], 1)
-        self.assertEqual(summary["failed_subreddits"], 1)
-        self.assertEqual(len(summary["errors"]), 1)
+        for config in cases:
+            with self.subTest(**config), patch.dict('app.settings.FETCHING_CONFIG', config):
+                self.assertEqual(await self.fetcher._preload_hot_posts(self.fetcher.target_subreddits), {})
         
-        # Verify error details
-        error = summary["errors"][0]
-        self.assertEqual(error["subreddit"], "failure")
-        self.assertIn("Simulated failure", error["error"])
+        self.mock_reddit_client.get_hot_posts_multi.assert_not_awaited()
+    
+    async def test_fetch_all_data_streams_ndjson(self):
+        """Test that subreddit data is streamed to an NDJSON file when requested."""
+        self.fetcher.target_subreddits = ["test1", "test2"]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "results.ndjson")
+            self.fetcher._fetch_subreddit_data = AsyncMock(side_effect=fetch_always_succeeds)
+            result = await self.fetcher.fetch_all_data(output_path=output_path)
+            
+            with open(output_path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        
+        # Only the manifest is kept in memory
+        self.assertNotIn("subreddits", result)
+        self.assertEqual(result["output_path"], output_path)
+        self.assertEqual(result["summary"]["successful_subreddits"], 2)
+        self.assertEqual(result["summary"]["total_comments"], 2)
+        
+        # One line per subreddit
+        self.assertEqual(sorted(record["name"] for record in records), ["test1", "test2"])
+        
+        # Post and comment records are serialized as JSON objects
+        self.assertEqual(records[0]["posts"][0]["title"], "Test Post")
+        self.assertEqual(records[0]["posts"][0]["comments"][0]["id"], "test_comment")
+    
+    async def test_fetch_all_data_streams_gzip_ndjson(self):
+        """Test that NDJSON output is gzip-compressed when the path ends in .gz."""
+        self.fetcher.target_subreddits = ["test1"]
+        
+        async def mock_fetch_subreddit_data(subreddit_name, **kwargs):
+            return {"name": subreddit_name, "posts": [Post(id="post1")], "post_count": 1, "comment_count": 0}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "results.ndjson.gz")
+            self.fetcher._fetch_subreddit_data = AsyncMock(side_effect=mock_fetch_subreddit_data)
+            await self.fetcher.fetch_all_data(output_path=output_path)
+            
+            with gzip.open(output_path, "rt", encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
         
-        # Verify only successful subreddit data is included
-        self.assertEqual(len(result["subreddits"]), 1)
-        self.assertIn("success", result["subreddits"])
-        self.assertNotIn("failure", result["subreddits"])
+        self.assertEqual([record["name"] for record in records], ["test1"])
+    
+    async def test_iter_subreddits_yields_records_as_they_complete(self):
+        """Test that subreddit records are yielded in completion order and failures are skipped."""
+        self.fetcher.target_subreddits = ["slow", "fast", "broken"]
+        release_slow = asyncio.Event()
+        
+        async def mock_fetch_subreddit_data(subreddit_name, **kwargs):
+            if subreddit_name == "slow":
+                await release_slow.wait()
+            if subreddit_name == "broken":
+                raise Exception("Simulated failure")
+            return {"name": subreddit_name, "posts": [Post(id=f"{subreddit_name}_post")], "post_count": 1, "comment_count": 0}
+        
+        summary = _new_summary()
+        self.fetcher._fetch_subreddit_data = AsyncMock(side_effect=mock_fetch_subreddit_data)
+        records = self.fetcher.iter_subreddits(summary)
+        first = await anext(records)
+        release_slow.set()
+        rest = [record async for record in records]
+        
+        self.assertEqual(first["name"], "fast")
+        self.assertEqual([record["name"] for record in rest], ["slow"])
+        self.assertEqual(summary["successful_subreddits"], 2)
+        self.assertEqual(summary["total_posts"], 2)
+        self.assertEqual(summary["failed_subreddits"], 1)
+        self.assertEqual(summary["errors"][0]["subreddit"], "broken")
     
     def test_settings_integration(self):
         """Test integration with settings module."""
@@ -271,12 +465,16 @@ class TestDataFetcher(unittest.TestCase):
         config = get_fetching_config()
         subreddits = get_target_subreddits()
         
-        self.assertIsInstance(config, dict)
-        self.assertIsInstance(subreddits, list)
+        self.assertIsInstance(config, Mapping)
+        self.assertIsInstance(subreddits, tuple)
         self.assertGreater(len(subreddits), 0)
         
+        # Configuration views are built once and shared
+        self.assertIs(get_fetching_config(), config)
+        self.assertIs(get_cache_config(), get_cache_config())
+        
         # Verify required config keys
-        required_keys = ["posts_per_subreddit", "comments_per_post", "use_development_list", "request_delay"]
+        required_keys = ["posts_per_subreddit", "comments_per_post", "use_development_list", "subreddit_concurrency"]
         for key in required_keys:
             self.assertIn(key, config)
 
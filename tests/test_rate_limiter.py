@@ -0,0 +1,85 @@
+"""
+Unit tests for the RedditRateLimiter class.
+
+These tests verify the header-driven request pacing shared by concurrent requests.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the parent directory to the Python path so we can import our modules
+# when this file is run directly (pytest gets it from pytest.ini)
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.rate_limiter import RedditRateLimiter
+
+
+class TestRedditRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the RedditRateLimiter class."""
+    
+    def setUp(self):
+        """Set up a fake clock that only advances while the limiter sleeps."""
+        self.clock = 0.0
+        
+        async def fake_sleep(delay):
+            self.clock += delay
+        
+        monotonic_patcher = patch('app.rate_limiter.time.monotonic', side_effect=lambda: self.clock)
+        sleep_patcher = patch('app.rate_limiter.asyncio.sleep', side_effect=fake_sleep)
+        monotonic_patcher.start()
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(monotonic_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+        
+        self.limiter = RedditRateLimiter(min_remaining=5)
+    
+    async def test_no_wait_before_first_response(self):
+        """Test that requests are not delayed before any quota is known."""
+        await self.limiter.acquire()
+        await self.limiter.acquire()
+        
+        self.mock_sleep.assert_not_called()
+    
+    async def test_no_wait_with_plenty_of_quota(self):
+        """Test that requests go out immediately while quota remains."""
+        self.limiter.update("100.0", "60")
+        
+        for _ in range(10):
+            await self.limiter.acquire()
+        
+        self.mock_sleep.assert_not_called()
+        self.assertEqual(self.limiter.remaining, 90)
+    
+    async def test_spreads_low_quota_over_window(self):
+        """Test that a low quota is spread evenly over the rest of the window."""
+        self.limiter.update("4.0", "60")
+        
+        await self.limiter.acquire()
+        
+        self.mock_sleep.assert_called_once_with(15.0)
+    
+    async def test_exhausted_quota_waits_for_reset(self):
+        """Test that an exhausted quota waits for the window to reset."""
+        self.limiter.update("0", "30")
+        
+        await self.limiter.acquire()
+        self.mock_sleep.assert_called_once_with(30.0)
+        
+        # After the reset the limiter waits for fresh headers
+        await self.limiter.acquire()
+        self.mock_sleep.assert_called_once()
+        self.assertIsNone(self.limiter.remaining)
+    
+    def test_update_ignores_missing_headers(self):
+        """Test that responses without rate limit headers leave the quota unchanged."""
+        self.limiter.update("50", "60")
+        self.limiter.update(None, None)
+        
+        self.assertEqual(self.limiter.remaining, 50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
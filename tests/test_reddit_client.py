@@ -4,39 +4,405 @@ Unit tests for the RedditClient class.
 These tests verify the functionality of the Reddit API client service.
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import sys
 import os
+import tempfile
 
 # Add the parent directory to the Python path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# when this file is run directly (pytest gets it from pytest.ini)
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from asyncpraw.models import Comment
+from app.cache import TTLCache
+from app.config import get_config
+from app.reddit_client import RedditClient, create_connector
+
+# Tests marked @live hit the real Reddit API. They are skipped unless
+# REDLENS_LIVE_TESTS=1 so the default run needs no network or credentials.
+LIVE_TESTS = os.environ.get("REDLENS_LIVE_TESTS") == "1"
+
+# Stand-in credentials for the offline tests
+DUMMY_CREDENTIALS = {
+    "CLIENT_ID": "test_client_id",
+    "CLIENT_SECRET": "test_client_secret",
+    "USER_AGENT": "redlens tests"
+}
+
 
-from app.reddit_client import RedditClient
+def live(test):
+    """Mark a test or test class that hits the live Reddit API (selectable with pytest -m live)."""
+    test.live = True
+    return unittest.skipUnless(LIVE_TESTS, "set REDLENS_LIVE_TESTS=1 to run tests against the live Reddit API")(test)
 
 
-class TestRedditClient(unittest.TestCase):
+def fake_response(status, payload=None, headers=None):
+    """Create a stand-in for the context manager returned by ``session.get``."""
+    response = Mock(status=status, headers=headers or {})
+    response.json = AsyncMock(return_value=payload)
+    if status >= 400:
+        response.raise_for_status.side_effect = Exception(f"HTTP {status}")
+    context = MagicMock()
+    context.__aenter__.return_value = response
+    return context
+
+
+class TestRedditClient(unittest.IsolatedAsyncioTestCase):
     """Test cases for the RedditClient class."""
     
-    def setUp(self):
+    async def asyncSetUp(self):
         """Set up test fixtures before each test method."""
+        # Offline tests run with stand-in credentials instead of the .env file
+        env_patcher = patch.dict(os.environ, DUMMY_CREDENTIALS)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        get_config.cache_clear()
+        self.addCleanup(get_config.cache_clear)
+        
         self.client = RedditClient()
     
+    async def asyncTearDown(self):
+        """Release the client's HTTP session after each test method."""
+        await self.client.close()
+    
     def test_client_initialization(self):
         """Test that the Reddit client initializes correctly."""
         self.assertIsNotNone(self.client.reddit)
-        self.assertEqual(self.client.reddit.config.user_agent, "redlens by u/No_Introduction9777")
+        self.assertEqual(self.client.reddit.config.user_agent, get_config().user_agent)
+        self.assertTrue(self.client.reddit.read_only)
+    
+    async def test_verify_auth(self):
+        """Test that verify_auth reports whether the credentials are accepted."""
+        with patch.object(self.client.reddit.auth, 'scopes', new_callable=AsyncMock, return_value={"*"}):
+            self.assertTrue(await self.client.verify_auth())
+        
+        with patch.object(self.client.reddit.auth, 'scopes', new_callable=AsyncMock,
+                          side_effect=Exception("401 Unauthorized")):
+            self.assertFalse(await self.client.verify_auth())
+    
+    async def test_json_session_is_reused(self):
+        """Test that raw JSON requests share one keep-alive session."""
+        session = self.client._get_session()
+        self.assertIs(self.client._get_session(), session)
+        
+        await self.client.close()
+        self.assertTrue(session.closed)
+    
+    async def test_clients_share_connector(self):
+        """Test that clients given one connector share it and leave it open."""
+        connector = create_connector()
+        first = RedditClient(connector=connector)
+        second = RedditClient(connector=connector)
+        try:
+            self.assertIs(first._get_session().connector, connector)
+            self.assertIs(second._get_session().connector, connector)
+            
+            await first.close()
+            self.assertFalse(connector.closed)
+        finally:
+            await second.close()
+            await connector.close()
+    
+    async def test_get_subreddit_info_uses_cache(self):
+        """Test that cached subreddit info is returned without an API call."""
+        cached_info = {"name": "python", "title": "Python", "subscribers": 1200000}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.client._cache = TTLCache(tmp_dir)
+            self.client._cache.set("subreddit_info:python", cached_info)
+            
+            with patch.object(self.client.reddit, 'subreddit', new_callable=AsyncMock) as mock_subreddit:
+                subreddit_info = await self.client.get_subreddit_info("Python")
+                mock_subreddit.assert_not_awaited()
+                
+                # force_refresh bypasses the cache
+                mock_subreddit.side_effect = Exception("network disabled")
+                with self.assertRaises(Exception):
+                    await self.client.get_subreddit_info("python", force_refresh=True)
+        
+        self.assertEqual(subreddit_info, cached_info)
+    
+    async def test_get_subreddit_info_fetches_on_cache_miss(self):
+        """Test that subreddit info is fetched and cached on a cache miss."""
+        subreddit = Mock(
+            display_name="python", title="Python", description="News about Python",
+            subscribers=1200000, created_utc=1201233135.0,
+            public_description="News about the programming language Python", over18=False
+        )
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.client._cache = TTLCache(tmp_dir)
+            with patch.object(self.client.reddit, 'subreddit', new_callable=AsyncMock, return_value=subreddit) as mock_subreddit:
+                subreddit_info = await self.client.get_subreddit_info("python")
+            
+            mock_subreddit.assert_awaited_once_with("python", fetch=True)
+            self.assertEqual(subreddit_info["name"], "python")
+            self.assertEqual(subreddit_info["subscribers"], 1200000)
+            self.assertEqual(self.client._cache.get("subreddit_info:python", 60), subreddit_info)
+    
+    async def test_get_subreddits_info_bulk(self):
+        """Test that subreddit info is fetched in bulk and cached subreddits are skipped."""
+        cached_info = {"name": "python", "title": "Python", "subscribers": 1200000}
+        listing = {"data": {"children": [
+            {"kind": "t5", "data": {"display_name": "science", "title": "Science", "subscribers": 900000}},
+        ]}}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.client._cache = TTLCache(tmp_dir)
+            self.client._cache.set("subreddit_info:python", cached_info)
+            
+            with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=listing) as mock_get_json:
+                info_map = await self.client.get_subreddits_info_bulk(["python", "Science", "missing"])
+            
+            # Only uncached subreddits are requested, in a single request
+            mock_get_json.assert_awaited_once_with("/api/info.json", params={"sr_name": "Science,missing"})
+            self.assertIsNotNone(self.client._cache.get("subreddit_info:science", 60))
+        
+        self.assertEqual(info_map["python"], cached_info)
+        self.assertEqual(info_map["Science"]["subscribers"], 900000)
+        self.assertNotIn("missing", info_map)
+    
+    async def test_get_hot_posts_collects_listing(self):
+        """Test that the Async PRAW hot listing is collected into a list."""
+        submissions = [Mock(id=f"p{i}", title=f"Post {i}", score=i) for i in range(3)]
+        
+        async def hot(limit):
+            for submission in submissions[:limit]:
+                yield submission
+        
+        subreddit = Mock(hot=hot)
+        with patch.object(self.client.reddit, 'subreddit', new_callable=AsyncMock, return_value=subreddit):
+            posts = await self.client.get_hot_posts("python", limit=2)
+        
+        self.assertEqual([post.id for post in posts], ["p0", "p1"])
+    
+    async def test_get_hot_posts_reports_subreddit_on_error(self):
+        """Test that failures name the subreddit that could not be fetched."""
+        with patch.object(self.client.reddit, 'subreddit', new_callable=AsyncMock,
+                          side_effect=Exception("received 404 HTTP response")):
+            with self.assertRaisesRegex(Exception, "r/missing_subreddit"):
+                await self.client.get_hot_posts("missing_subreddit")
+    
+    async def test_get_hot_posts_fast(self):
+        """Test that hot posts are read from a single listing response."""
+        listing = {"data": {"children": [
+            {"kind": "t5", "data": {"display_name": "python"}},
+            {"kind": "t3", "data": {"id": "abc", "title": "First"}},
+            {"kind": "t3", "data": {"id": "def", "title": "Second"}},
+        ]}}
+        
+        with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=listing) as mock_get_json:
+            posts = await self.client.get_hot_posts_fast("python", limit=1)
+        
+        # Entries that are not posts are skipped
+        mock_get_json.assert_awaited_once_with("/r/python/hot.json", params={"limit": 1})
+        self.assertEqual(posts, [{"id": "abc", "title": "First"}])
+    
+    async def test_get_hot_posts_fast_missing_subreddit(self):
+        """Test that a subreddit redirected to the search page is reported as a failure."""
+        session = Mock()
+        session.get.return_value = fake_response(
+            302, headers={"Location": "https://www.reddit.com/subreddits/search.json?q=missing"}
+        )
+        
+        with patch.object(self.client, '_get_session', return_value=session):
+            with self.assertRaisesRegex(Exception, r"r/missing.*search"):
+                await self.client.get_hot_posts_fast("missing")
+        
+        self.assertIs(session.get.call_args.kwargs["allow_redirects"], False)
+    
+    async def test_get_hot_posts_multi(self):
+        """Test that a multireddit listing is split back into per-subreddit posts."""
+        listing = {"data": {"children": [
+            {"kind": "t3", "data": {"id": "a1", "subreddit": "Python"}},
+            {"kind": "t5", "data": {"id": "s1", "display_name": "science"}},
+            {"kind": "t3", "data": {"id": "b1", "subreddit": "science"}},
+            {"kind": "t3", "data": {"id": "a2", "subreddit": "Python"}},
+            {"kind": "t3", "data": {"id": "a3", "subreddit": "Python"}},
+        ]}}
+        
+        with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=listing) as mock_get_json:
+            posts = await self.client.get_hot_posts_multi(["python", "science", "empty"], limit_per_subreddit=2)
+        
+        mock_get_json.assert_awaited_once_with("/r/python+science+empty/hot.json", params={"limit": 6})
+        self.assertEqual([post["id"] for post in posts["python"]], ["a1", "a2"])
+        self.assertEqual([post["id"] for post in posts["science"]], ["b1"])
+        self.assertEqual(posts["empty"], [])
+    
+    async def test_get_hot_posts_multi_missing_subreddit(self):
+        """Test that a multireddit with a missing subreddit fails instead of following the redirect."""
+        session = Mock()
+        session.get.return_value = fake_response(
+            302, headers={"Location": "https://www.reddit.com/subreddits/search.json?q=missing"}
+        )
+        
+        with patch.object(self.client, '_get_session', return_value=session):
+            with self.assertRaisesRegex(Exception, r"r/python\+missing"):
+                await self.client.get_hot_posts_multi(["python", "missing"])
+    
+    async def test_get_json_retries_rate_limited_requests(self):
+        """Test that 429 responses are retried with exponential backoff."""
+        session = Mock()
+        session.get.side_effect = [fake_response(429), fake_response(503), fake_response(200, {"ok": True})]
+        
+        with patch.object(self.client, '_get_session', return_value=session), \
+                patch('app.reddit_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await self.client._get_json("/r/python/hot.json")
+            
+            # Retries give up after max_retries and surface the error
+            self.client.max_retries = 1
+            session.get.side_effect = [fake_response(429), fake_response(429)]
+            with self.assertRaises(Exception):
+                await self.client._get_json("/r/python/hot.json")
+            
+            # A longer Retry-After header overrides the backoff delay
+            session.get.side_effect = [
+                fake_response(429, headers={"Retry-After": "7"}),
+                fake_response(200, {"ok": True})
+            ]
+            await self.client._get_json("/r/python/hot.json")
+        
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [1.0, 2.0, 1.0, 7.0])
+    
+    async def test_get_top_comments_stops_at_limit(self):
+        """Test that the comment tree walk is breadth-first and stops at the limit."""
+        replies = [Mock(spec=Comment, id=f"a{i}", replies=[]) for i in range(3)]
+        top_level = [
+            Mock(spec=Comment, id="a", replies=replies),
+            Mock(spec=Comment, id="b", replies=[])
+        ]
+        post = Mock(_fetched=True, comments=MagicMock())
+        post.comments.replace_more = AsyncMock()
+        post.comments.__iter__.side_effect = lambda: iter(top_level)
+        
+        comments = await self.client.get_top_comments(post, limit=3)
+        everything = await self.client.get_top_comments(post, limit=10)
+        
+        self.assertEqual([c.id for c in comments], ["a", "b", "a0"])
+        self.assertEqual([c.id for c in everything], ["a", "b", "a0", "a1", "a2"])
+    
+    async def test_get_top_comments_loads_top_sorted_forest(self):
+        """Test that an unloaded post is fetched once with top sorting and the comment limit."""
+        post = Mock(_fetched=False, load=AsyncMock(), comments=MagicMock())
+        post.comments.replace_more = AsyncMock()
+        post.comments.__iter__.side_effect = lambda: iter([Mock(spec=Comment, id="a", replies=[])])
+        
+        with patch.object(self.client.reddit, 'submission', new_callable=AsyncMock, return_value=post) as mock_submission:
+            comments = await self.client.get_top_comments("abc", limit=20)
+        
+        mock_submission.assert_awaited_once_with("abc", fetch=False)
+        post.load.assert_awaited_once()
+        self.assertEqual(post.comment_sort, "top")
+        self.assertEqual(post.comment_limit, 20)
+        self.assertEqual([c.id for c in comments], ["a"])
+    
+    async def test_get_top_comments_fast(self):
+        """Test that the JSON comment tree is flattened breadth-first without stubs."""
+        def comment(comment_id, replies=""):
+            return {"kind": "t1", "data": {"id": comment_id, "replies": replies}}
+        
+        def listing(*children):
+            return {"kind": "Listing", "data": {"children": list(children)}}
+        
+        response = [
+            listing({"kind": "t3", "data": {"id": "abc"}}),
+            listing(
+                comment("a", replies=listing(comment("a1"), {"kind": "more", "data": {}})),
+                comment("b"),
+                {"kind": "more", "data": {}}
+            )
+        ]
+        
+        with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=response) as mock_get_json:
+            comments = await self.client.get_top_comments_fast("abc", "python", limit=10)
+            limited = await self.client.get_top_comments_fast("abc", "python", limit=2)
+        
+        mock_get_json.assert_awaited_with("/r/python/comments/abc.json", params={"limit": 2, "sort": "top"})
+        self.assertEqual([c["id"] for c in comments], ["a", "b", "a1"])
+        self.assertEqual([c["id"] for c in limited], ["a", "b"])
+    
+    async def test_get_popular_subreddits_filters_listing(self):
+        """Test that popular subreddits are filtered from a single listing response."""
+        listing = {"data": {"children": [
+            {"data": {"display_name": "python", "over18": False, "subscribers": 1200000}},
+            {"data": {"display_name": "nsfw_pics", "over18": True, "subscribers": 500000}},
+            {"data": {"display_name": "CircleJerk", "over18": False, "subscribers": 300000}},
+            {"data": {"display_name": "tiny", "over18": False, "subscribers": 42}},
+            {"data": {"display_name": "science", "over18": False, "subscribers": 900000}},
+        ]}}
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.client._cache = TTLCache(tmp_dir)
+            with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=listing) as mock_get_json:
+                popular = await self.client.get_popular_subreddits(limit=10)
+                
+                # Smaller limits are served from the same cached listing
+                top_one = await self.client.get_popular_subreddits(limit=1)
+        
+        # One listing request replaces per-subreddit lookups
+        mock_get_json.assert_awaited_once()
+        self.assertEqual(popular, ["python", "science"])
+        self.assertEqual(top_one, ["python"])
+    
+    async def test_get_trending_subreddits_filters_listing(self):
+        """Test that trending subreddits require a larger audience than popular ones."""
+        listing = {"data": {"children": [
+            {"data": {"display_name": "python", "over18": False, "subscribers": 1200000}},
+            {"data": {"display_name": "nsfw_pics", "over18": True, "subscribers": 500000}},
+            {"data": {"display_name": "growing", "over18": False, "subscribers": 20000}},
+            {"data": {"display_name": "science", "over18": False, "subscribers": 900000}},
+        ]}}
+        
+        with patch.object(self.client, '_get_json', new_callable=AsyncMock, return_value=listing):
+            trending = await self.client.get_trending_subreddits(limit=5)
+        
+        self.assertEqual(trending, ["python", "science"])
+    
+    @patch('app.config.load_dotenv')
+    def test_missing_credentials(self, mock_load_dotenv):
+        """Test that initialization fails with missing credentials."""
+        get_config.cache_clear()
+        self.addCleanup(get_config.cache_clear)
+        
+        with patch.dict(os.environ, {"CLIENT_ID": ""}):
+            with self.assertRaises(ValueError):
+                RedditClient()
+
+@live
+class TestRedditClientLive(unittest.TestCase):
+    """Live API tests, sharing one client so the OAuth token is fetched once."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the event loop and client shared by all live tests."""
+        cls.runner = asyncio.Runner()
+        cls.client = cls.runner.run(cls._create_client())
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared client and close its event loop."""
+        cls.runner.run(cls.client.close())
+        cls.runner.close()
+    
+    @staticmethod
+    async def _create_client():
+        """Create the client inside the shared event loop."""
+        return RedditClient()
     
     def test_connection(self):
         """Test that the client can connect to Reddit API."""
         # This is a live test - it will actually hit the Reddit API
-        connection_successful = self.client.test_connection()
+        connection_successful = self.runner.run(self.client.test_connection())
         self.assertTrue(connection_successful)
     
     def test_get_subreddit_info(self):
         """Test retrieving subreddit information."""
         # Test with a well-known subreddit
-        subreddit_info = self.client.get_subreddit_info("python")
+        subreddit_info = self.runner.run(self.client.get_subreddit_info("python"))
         
         # Verify the returned data structure
         self.assertIsInstance(subreddit_info, dict)
@@ -48,7 +414,7 @@ class TestRedditClient(unittest.TestCase):
     def test_get_hot_posts(self):
         """Test retrieving hot posts from a subreddit."""
         # Test with a small limit to avoid long test times
-        posts = self.client.get_hot_posts("python", limit=3)
+        posts = self.runner.run(self.client.get_hot_posts("python", limit=3))
         
         # Verify we got posts back
         self.assertIsInstance(posts, list)
@@ -64,11 +430,11 @@ class TestRedditClient(unittest.TestCase):
     def test_get_top_comments(self):
         """Test retrieving comments from a post."""
         # First get a post to test with
-        posts = self.client.get_hot_posts("python", limit=1)
+        posts = self.runner.run(self.client.get_hot_posts("python", limit=1))
         self.assertGreater(len(posts), 0)
         
         post = posts[0]
-        comments = self.client.get_top_comments(post, limit=5)
+        comments = self.runner.run(self.client.get_top_comments(post, limit=5))
         
         # Verify comments structure
         self.assertIsInstance(comments, list)
@@ -80,7 +446,7 @@ class TestRedditClient(unittest.TestCase):
     
     def test_get_popular_subreddits(self):
         """Test retrieving popular subreddits."""
-        popular = self.client.get_popular_subreddits(limit=10)
+        popular = self.runner.run(self.client.get_popular_subreddits(limit=10))
         
         # Verify we got subreddits back
         self.assertIsInstance(popular, list)
@@ -94,7 +460,7 @@ class TestRedditClient(unittest.TestCase):
     
     def test_get_trending_subreddits(self):
         """Test retrieving trending subreddits."""
-        trending = self.client.get_trending_subreddits(limit=5)
+        trending = self.runner.run(self.client.get_trending_subreddits(limit=5))
         
         # Verify we got subreddits back
         self.assertIsInstance(trending, list)
@@ -109,13 +475,7 @@ class TestRedditClient(unittest.TestCase):
     def test_invalid_subreddit(self):
         """Test behavior with an invalid subreddit name."""
         with self.assertRaises(Exception):
-            self.client.get_hot_posts("this_subreddit_should_not_exist_12345")
-    
-    @patch('app.reddit_client.CLIENT_ID', None)
-    def test_missing_credentials(self):
-        """Test that initialization fails with missing credentials."""
-        with self.assertRaises(ValueError):
-            RedditClient()
+            self.runner.run(self.client.get_hot_posts("this_subreddit_should_not_exist_12345"))
 
 
 if __name__ == '__main__':